@@ -4,6 +4,7 @@ Interactive PF Risk Simulator dashboard
 Run with: streamlit run pf_liquidity_risk/app.py
 """
 
+from dataclasses import fields
 import json
 from pathlib import Path
 import time
@@ -11,12 +12,24 @@ import time
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import streamlit as st
 
 # Import your simulation components
 from pf_liquidity_risk.modeling.config_model import PFConfig
-from pf_liquidity_risk.modeling.engine import PFInvestmentModel
-from pf_liquidity_risk.reporting import equity_loss_metrics
+from pf_liquidity_risk.modeling.engine import (
+    DEFAULT,
+    EXIT,
+    REFI_FAIL,
+    STATUS_LABELS,
+    PFInvestmentModel,
+)
+from pf_liquidity_risk.reporting import (
+    distribution_summary,
+    equity_loss_metrics,
+    survival_curve,
+)
 
 # ==========================================
 # Translations
@@ -55,6 +68,7 @@ TRANSLATIONS = {
         "run_simulation": "🚀 Run Simulation",
         "running": "Running {:,} simulations...",
         "completed": "✅ Simulation completed in {:.2f} seconds",
+        "loaded_cached": "✅ Loaded cached results",
         "key_metrics": "📊 Key Risk Metrics",
         "set_base": "Set as Base Case",
         "set_base_help": "Save current results as baseline for comparison",
@@ -178,6 +192,7 @@ TRANSLATIONS = {
         "run_simulation": "🚀 시뮬레이션 실행",
         "running": "{:,}회 시뮬레이션 실행 중...",
         "completed": "✅ 시뮬레이션 완료 ({:.2f}초)",
+        "loaded_cached": "✅ 캐시된 결과를 불러왔습니다",
         "key_metrics": "📊 핵심 리스크 지표",
         "set_base": "기준 케이스로 설정",
         "set_base_help": "현재 결과를 비교 기준선으로 저장",
@@ -272,9 +287,9 @@ TRANSLATIONS = {
 }
 
 
-def t(key: str, lang: str) -> str:
-    """Translation helper function"""
-    return TRANSLATIONS[lang].get(key, key)
+def strings_for(lang: str) -> dict[str, str]:
+    """String table for one language; bind it once per render as ``T``."""
+    return TRANSLATIONS[lang]
 
 
 # ==========================================
@@ -348,20 +363,74 @@ st.markdown(
 # ==========================================
 
 
-@st.cache_data(ttl=300)
-def run_simulation_cached(config_dict: dict, iterations: int, seed: int) -> pd.DataFrame:
-    """Run simulation with caching for performance"""
-    config = PFConfig(**config_dict)
+def _config_cache_key(config: PFConfig) -> tuple:
+    """Cache key built from the primitive init fields only (no deep dict hashing)."""
+    return tuple(getattr(config, f.name) for f in fields(config) if f.init)
+
+
+@st.cache_data(
+    ttl=300, max_entries=32, show_spinner=False, hash_funcs={PFConfig: _config_cache_key}
+)
+def run_simulation_cached(
+    config: PFConfig, iterations: int, seed: int
+) -> tuple[pd.DataFrame, float]:
+    """
+    Run simulation with caching for performance. Also returns the wall-clock
+    time the result was computed at, so callers can tell a cache hit (stamp
+    older than their call) from a fresh run.
+    """
     rng = np.random.default_rng(seed)
     model = PFInvestmentModel(config, rng)
-    results = [model.simulate_path() for _ in range(iterations)]
-    return pd.DataFrame(results)
+    # Compiled kernel when numba is installed, vectorized NumPy engine otherwise.
+    return model.simulate_many(iterations), time.time()
+
+
+def status_codes(df: pd.DataFrame) -> np.ndarray:
+    """Integer outcome codes (engine order) of the categorical status column."""
+    return df["status"].cat.codes.to_numpy()
+
+
+def result_arrays(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Split a result frame once into the plain arrays the charts consume."""
+    codes = status_codes(df)
+    is_exit = codes == EXIT
+    return {
+        "codes": codes,
+        "months": df["month"].to_numpy(),
+        "exit_irr": df["irr"].to_numpy()[is_exit],
+        "exit_mult": df["exit_multiple"].to_numpy()[is_exit],
+    }
+
 
+def results_csv(df: pd.DataFrame) -> bytes:
+    """Serialize results to UTF-8 CSV bytes with pyarrow's C writer (NaN -> empty)."""
+    buf = pa.BufferOutputStream()
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buf)
+    return buf.getvalue().to_pybytes()
 
-def create_outcome_chart(df: pd.DataFrame, lang: str) -> go.Figure:
+
+def _histogram_trace(values: np.ndarray, bins: int, name: str, color: str) -> go.Bar:
+    """Pre-bin on the server so the figure carries bin counts, not every sample."""
+    counts, edges = np.histogram(values, bins=bins)
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        name=name,
+        marker_color=color,
+        opacity=0.7,
+    )
+
+
+def create_outcome_chart(codes: np.ndarray, lang: str) -> go.Figure:
     """Create interactive outcome distribution chart"""
-    counts = df["status"].value_counts()
-    percentages = (counts / len(df) * 100).round(2)
+    T = strings_for(lang)
+    counts_arr = np.bincount(codes, minlength=len(STATUS_LABELS))
+    # Most frequent outcome first; statuses that never occurred are dropped.
+    order = [i for i in np.argsort(-counts_arr, kind="stable") if counts_arr[i] > 0]
+    labels = STATUS_LABELS[order]
+    counts = counts_arr[order]
+    percentages = (counts / len(codes) * 100).round(2)
 
     color_map = {
         "exit": "#2ECC71",
@@ -370,13 +439,13 @@ def create_outcome_chart(df: pd.DataFrame, lang: str) -> go.Figure:
         "survived_no_exit": "#3498DB",
     }
 
-    colors = [color_map.get(status, "#BDC3C7") for status in counts.index]
+    colors = [color_map.get(status, "#BDC3C7") for status in labels]
 
     fig = go.Figure(
         data=[
             go.Bar(
-                x=counts.index,
-                y=counts.values,
+                x=labels,
+                y=counts,
                 text=[f"{p}%" for p in percentages],
                 textposition="outside",
                 marker_color=colors,
@@ -389,9 +458,9 @@ def create_outcome_chart(df: pd.DataFrame, lang: str) -> go.Figure:
     max_val = counts.max()
 
     fig.update_layout(
-        title=t("outcome_dist", lang),
+        title=T["outcome_dist"],
         xaxis_title="Outcome",
-        yaxis_title=t("frequency", lang),
+        yaxis_title=T["frequency"],
         yaxis={"range": [0, max_val * 1.2]},
         height=400,
         showlegend=False,
@@ -402,14 +471,13 @@ def create_outcome_chart(df: pd.DataFrame, lang: str) -> go.Figure:
     return fig
 
 
-def create_irr_histogram(df: pd.DataFrame, lang: str) -> go.Figure:
+def create_irr_histogram(exit_irr: np.ndarray, lang: str) -> go.Figure:
     """Create IRR distribution histogram"""
-    exit_df = df[df["status"] == "exit"]
-
-    if exit_df.empty:
+    T = strings_for(lang)
+    if exit_irr.size == 0:
         fig = go.Figure()
         fig.add_annotation(
-            text=t("no_exits", lang),
+            text=T["no_exits"],
             xref="paper",
             yref="paper",
             x=0.5,
@@ -419,26 +487,18 @@ def create_irr_histogram(df: pd.DataFrame, lang: str) -> go.Figure:
         )
         return fig
 
-    median_irr = exit_df["irr"].median()
-    mean_irr = exit_df["irr"].mean()
+    median_irr = np.median(exit_irr)
+    mean_irr = np.mean(exit_irr)
 
     fig = go.Figure()
 
-    fig.add_trace(
-        go.Histogram(
-            x=exit_df["irr"],
-            nbinsx=50,
-            name=t("irr_dist", lang),
-            marker_color="#3498DB",
-            opacity=0.7,
-        )
-    )
+    fig.add_trace(_histogram_trace(exit_irr, 50, T["irr_dist"], "#3498DB"))
 
     fig.add_vline(
         x=median_irr,
         line_dash="dash",
         line_color="red",
-        annotation_text=f"{t('median', lang)}: {median_irr:.1%}",
+        annotation_text=f"{T['median']}: {median_irr:.1%}",
         annotation_position="top",
     )
 
@@ -446,14 +506,14 @@ def create_irr_histogram(df: pd.DataFrame, lang: str) -> go.Figure:
         x=mean_irr,
         line_dash="dash",
         line_color="green",
-        annotation_text=f"{t('mean', lang)}: {mean_irr:.1%}",
+        annotation_text=f"{T['mean']}: {mean_irr:.1%}",
         annotation_position="bottom",
     )
 
     fig.update_layout(
-        title=t("irr_dist", lang),
-        xaxis_title=t("irr", lang),
-        yaxis_title=t("frequency", lang),
+        title=T["irr_dist"],
+        xaxis_title=T["irr"],
+        yaxis_title=T["frequency"],
         height=400,
         showlegend=False,
     )
@@ -461,15 +521,14 @@ def create_irr_histogram(df: pd.DataFrame, lang: str) -> go.Figure:
     return fig
 
 
-def create_survival_curve(df: pd.DataFrame, lang: str, max_month: int = 36) -> go.Figure:
+def create_survival_curve(
+    codes: np.ndarray, end_months: np.ndarray, lang: str, max_month: int = 36
+) -> go.Figure:
     """Create survival rate curve (denominator = actual rows, x-axis = exit month)"""
-    n = len(df)
+    T = strings_for(lang)
     months = np.arange(1, max_month + 1)
-    survival_rates = []
-
-    for m in months:
-        failed = df[df["status"].isin(["default", "refi_fail"]) & (df["month"] <= m)]
-        survival_rates.append((n - len(failed)) / n)
+    failed = (codes == DEFAULT) | (codes == REFI_FAIL)
+    survival_rates = survival_curve(failed, end_months, max_month)
 
     fig = go.Figure()
 
@@ -478,7 +537,7 @@ def create_survival_curve(df: pd.DataFrame, lang: str, max_month: int = 36) -> g
             x=months,
             y=survival_rates,
             mode="lines+markers",
-            name=t("survival_rate", lang),
+            name=T["survival_rate"],
             line={"color": "#8E44AD", "width": 3},
             fill="tozeroy",
             fillcolor="rgba(142, 68, 173, 0.3)",
@@ -489,14 +548,14 @@ def create_survival_curve(df: pd.DataFrame, lang: str, max_month: int = 36) -> g
         y=0.95,
         line_dash="dash",
         line_color="red",
-        annotation_text=f"95% {t('threshold', lang)}",
+        annotation_text=f"95% {T['threshold']}",
         annotation_position="right",
     )
 
     fig.update_layout(
-        title=t("survival_curve", lang),
-        xaxis_title=t("month", lang),
-        yaxis_title=t("survival_rate", lang),
+        title=T["survival_curve"],
+        xaxis_title=T["month"],
+        yaxis_title=T["survival_rate"],
         height=400,
         yaxis_range=[0, 1.05],
     )
@@ -504,14 +563,13 @@ def create_survival_curve(df: pd.DataFrame, lang: str, max_month: int = 36) -> g
     return fig
 
 
-def create_exit_multiple_chart(df: pd.DataFrame, lang: str) -> go.Figure:
+def create_exit_multiple_chart(exit_mult: np.ndarray, lang: str) -> go.Figure:
     """Create exit multiple distribution"""
-    exit_df = df[df["status"] == "exit"]
-
-    if exit_df.empty or "exit_multiple" not in exit_df.columns:
+    T = strings_for(lang)
+    if exit_mult.size == 0:
         fig = go.Figure()
         fig.add_annotation(
-            text=t("no_exits", lang),
+            text=T["no_exits"],
             xref="paper",
             yref="paper",
             x=0.5,
@@ -521,25 +579,17 @@ def create_exit_multiple_chart(df: pd.DataFrame, lang: str) -> go.Figure:
         )
         return fig
 
-    median_mult = exit_df["exit_multiple"].median()
+    median_mult = np.median(exit_mult)
 
     fig = go.Figure()
 
-    fig.add_trace(
-        go.Histogram(
-            x=exit_df["exit_multiple"],
-            nbinsx=40,
-            name=t("exit_multiple_dist", lang),
-            marker_color="#27AE60",
-            opacity=0.7,
-        )
-    )
+    fig.add_trace(_histogram_trace(exit_mult, 40, T["exit_multiple_dist"], "#27AE60"))
 
     fig.add_vline(
         x=median_mult,
         line_dash="dash",
         line_color="red",
-        annotation_text=f"{t('median', lang)}: {median_mult:.2f}x",
+        annotation_text=f"{T['median']}: {median_mult:.2f}x",
         annotation_position="top",
     )
 
@@ -547,14 +597,14 @@ def create_exit_multiple_chart(df: pd.DataFrame, lang: str) -> go.Figure:
         x=1.0,
         line_dash="dot",
         line_color="orange",
-        annotation_text=f"{t('breakeven', lang)} (1.0x)",
+        annotation_text=f"{T['breakeven']} (1.0x)",
         annotation_position="bottom",
     )
 
     fig.update_layout(
-        title=t("exit_multiple_dist", lang),
-        xaxis_title=t("multiple", lang),
-        yaxis_title=t("frequency", lang),
+        title=T["exit_multiple_dist"],
+        xaxis_title=T["multiple"],
+        yaxis_title=T["frequency"],
         height=400,
         showlegend=False,
     )
@@ -567,6 +617,24 @@ def create_exit_multiple_chart(df: pd.DataFrame, lang: str) -> go.Figure:
 # ==========================================
 
 
+def build_figures(
+    arrays: dict[str, np.ndarray], lang: str, exit_month: int, revision: int
+) -> dict[str, go.Figure]:
+    """
+    Build the four result charts for one language. uirevision ties zoom/pan
+    state to the result, so it survives a language toggle but resets on a new run.
+    """
+    figs = {
+        "outcome": create_outcome_chart(arrays["codes"], lang),
+        "survival": create_survival_curve(arrays["codes"], arrays["months"], lang, exit_month),
+        "irr": create_irr_histogram(arrays["exit_irr"], lang),
+        "multiple": create_exit_multiple_chart(arrays["exit_mult"], lang),
+    }
+    for fig in figs.values():
+        fig.update_layout(uirevision=revision)
+    return figs
+
+
 def main():
     # Initialize session state
     if "has_run" not in st.session_state:
@@ -597,46 +665,47 @@ def main():
 
     # Get current language
     lang = st.session_state.get("lang", "en")
+    T = strings_for(lang)
 
     # Header
-    st.markdown(f'<p class="main-header">{t("title", lang)}</p>', unsafe_allow_html=True)
-    st.markdown(f"### {t('subtitle', lang)}")
+    st.markdown(f'<p class="main-header">{T["title"]}</p>', unsafe_allow_html=True)
+    st.markdown(f"### {T['subtitle']}")
     st.markdown("---")
 
     # Sidebar - Configuration
     with st.sidebar:
-        st.header(t("simulation_params", lang))
+        st.header(T["simulation_params"])
 
         # Simulation Settings
-        st.subheader(t("simulation_settings", lang))
+        st.subheader(T["simulation_settings"])
         iterations = st.slider(
-            t("num_iterations", lang),
+            T["num_iterations"],
             min_value=1000,
             max_value=50000,
             value=10000,
             step=1000,
-            help=t("iterations_help", lang),
+            help=T["iterations_help"],
         )
 
-        seed = st.number_input(t("random_seed", lang), value=42, help=t("seed_help", lang))
+        seed = st.number_input(T["random_seed"], value=42, help=T["seed_help"])
 
         st.markdown("---")
 
         # Capital Structure
-        st.subheader(t("capital_structure", lang))
+        st.subheader(T["capital_structure"])
 
-        use_normalized = st.checkbox(t("use_normalized", lang), value=True)
+        use_normalized = st.checkbox(T["use_normalized"], value=True)
 
         if use_normalized:
             initial_equity = st.number_input(
-                f"{t('initial_equity', lang)} ({t('index', lang)})",
+                f"{T['initial_equity']} ({T['index']})",
                 min_value=100.0,
                 max_value=200.0,
                 value=100.0,
                 step=10.0,
             )
             senior_loan = st.slider(
-                f"{t('senior_loan', lang)} ({t('index', lang)})",
+                f"{T['senior_loan']} ({T['index']})",
                 min_value=200.0,
                 max_value=500.0,
                 value=340.0,
@@ -645,17 +714,17 @@ def main():
             # Default 1.79 matches configs/public_config.py so the dashboard's
             # baseline run reproduces the README headline results.
             monthly_fixed_cost = st.slider(
-                f"{t('monthly_fixed_cost', lang)} ({t('pct_of_equity', lang)})",
+                f"{T['monthly_fixed_cost']} ({T['pct_of_equity']})",
                 min_value=0.2,
                 max_value=3.0,
                 value=1.79,
                 step=0.01,
             )
-            currency_display = t("index", lang)
+            currency_display = T["index"]
         else:
             initial_equity = (
                 st.number_input(
-                    f"{t('initial_equity', lang)} (KRW {t('billions', lang)})",
+                    f"{T['initial_equity']} (KRW {T['billions']})",
                     min_value=3.0,
                     max_value=10.0,
                     value=5.0,
@@ -665,7 +734,7 @@ def main():
             )
             senior_loan = (
                 st.slider(
-                    f"{t('senior_loan', lang)} (KRW {t('billions', lang)})",
+                    f"{T['senior_loan']} (KRW {T['billions']})",
                     min_value=10.0,
                     max_value=30.0,
                     value=17.0,
@@ -675,7 +744,7 @@ def main():
             )
             monthly_fixed_cost = (
                 st.slider(
-                    f"{t('monthly_fixed_cost', lang)} (KRW {t('millions', lang)})",
+                    f"{T['monthly_fixed_cost']} (KRW {T['millions']})",
                     min_value=10,
                     max_value=100,
                     value=20,
@@ -690,54 +759,51 @@ def main():
         leverage = senior_loan / initial_equity
 
         col1, col2 = st.columns(2)
-        col1.metric(t("ltv", lang), f"{ltv:.1%}")
-        col2.metric(t("leverage", lang), f"{leverage:.2f}x")
+        col1.metric(T["ltv"], f"{ltv:.1%}")
+        col2.metric(T["leverage"], f"{leverage:.2f}x")
 
         st.markdown("---")
 
         # Property NOI parameters
-        st.subheader(t("revenue_assumptions", lang))
+        st.subheader(T["revenue_assumptions"])
 
-        with st.expander(t("stabilization_phase", lang)):
+        with st.expander(T["stabilization_phase"]):
             if use_normalized:
                 stab_min = st.slider(
-                    f"{t('min', lang)} ({t('index', lang)})", 0.5, 5.0, 0.89, 0.1, key="stab_min"
+                    f"{T['min']} ({T['index']})", 0.5, 5.0, 0.89, 0.1, key="stab_min"
                 )
                 stab_mode = st.slider(
-                    f"{t('mode', lang)} ({t('index', lang)})", 1.0, 5.0, 2.14, 0.1, key="stab_mode"
+                    f"{T['mode']} ({T['index']})", 1.0, 5.0, 2.14, 0.1, key="stab_mode"
                 )
                 stab_max = st.slider(
-                    f"{t('max', lang)} ({t('index', lang)})", 2.0, 8.0, 2.68, 0.1, key="stab_max"
+                    f"{T['max']} ({T['index']})", 2.0, 8.0, 2.68, 0.1, key="stab_max"
                 )
             else:
-                stab_min = (
-                    st.slider(f"{t('min', lang)} (KRW M)", 30, 200, 40, 10, key="stab_min") * 1e6
-                )
+                stab_min = st.slider(f"{T['min']} (KRW M)", 30, 200, 40, 10, key="stab_min") * 1e6
                 stab_mode = (
-                    st.slider(f"{t('mode', lang)} (KRW M)", 50, 200, 100, 10, key="stab_mode")
-                    * 1e6
+                    st.slider(f"{T['mode']} (KRW M)", 50, 200, 100, 10, key="stab_mode") * 1e6
                 )
                 stab_max = (
-                    st.slider(f"{t('max', lang)} (KRW M)", 100, 300, 130, 10, key="stab_max") * 1e6
+                    st.slider(f"{T['max']} (KRW M)", 100, 300, 130, 10, key="stab_max") * 1e6
                 )
 
             stabilization_revenue_dist = (stab_min, stab_mode, stab_max)
 
-        with st.expander(t("post_opening", lang)):
+        with st.expander(T["post_opening"]):
             if use_normalized:
                 post_min = st.slider(
-                    f"{t('min', lang)} ({t('index', lang)})", 1.0, 5.0, 2.14, 0.1, key="post_min"
+                    f"{T['min']} ({T['index']})", 1.0, 5.0, 2.14, 0.1, key="post_min"
                 )
                 post_mode = st.slider(
-                    f"{t('mode', lang)} ({t('index', lang)})", 2.0, 8.0, 3.57, 0.1, key="post_mode"
+                    f"{T['mode']} ({T['index']})", 2.0, 8.0, 3.57, 0.1, key="post_mode"
                 )
                 post_max = st.slider(
-                    f"{t('max', lang)} ({t('index', lang)})", 3.0, 10.0, 4.46, 0.1, key="post_max"
+                    f"{T['max']} ({T['index']})", 3.0, 10.0, 4.46, 0.1, key="post_max"
                 )
             else:
                 post_min = (
                     st.slider(
-                        f"{t('min', lang)} (KRW {t('millions', lang)})",
+                        f"{T['min']} (KRW {T['millions']})",
                         80,
                         250,
                         100,
@@ -748,7 +814,7 @@ def main():
                 )
                 post_mode = (
                     st.slider(
-                        f"{t('mode', lang)} (KRW {t('millions', lang)})",
+                        f"{T['mode']} (KRW {T['millions']})",
                         150,
                         300,
                         180,
@@ -759,7 +825,7 @@ def main():
                 )
                 post_max = (
                     st.slider(
-                        f"{t('max', lang)} (KRW {t('millions', lang)})",
+                        f"{T['max']} (KRW {T['millions']})",
                         200,
                         400,
                         220,
@@ -774,23 +840,23 @@ def main():
         st.markdown("---")
 
         # Interest Rate Parameters
-        st.subheader(t("interest_rates", lang))
+        st.subheader(T["interest_rates"])
 
-        st.info(t("rate_info", lang))
+        st.info(T["rate_info"])
 
         # Use pipeline-calibrated rates (BOK ECOS) as defaults when available.
         calib_pre, calib_post, calib_src = load_calibrated_rates()
         if calib_src:
-            st.caption("📡 " + t("calibrated_note", lang).format(calib_src))
+            st.caption("📡 " + T["calibrated_note"].format(calib_src))
         pre_d = calib_pre or (0.10, 0.14, 0.18)
         post_d = calib_post or (0.05, 0.07, 0.09)
 
-        with st.expander(t("pre_refi_rates", lang)):
+        with st.expander(T["pre_refi_rates"]):
             pre_refi_min = st.slider(
-                t("min_rate", lang), 0.03, 0.20, pre_d[0], 0.001, key="pre_refi_min", format="%.3f"
+                T["min_rate"], 0.03, 0.20, pre_d[0], 0.001, key="pre_refi_min", format="%.3f"
             )
             pre_refi_mode = st.slider(
-                t("mode_rate", lang),
+                T["mode_rate"],
                 0.03,
                 0.25,
                 pre_d[1],
@@ -799,13 +865,13 @@ def main():
                 format="%.3f",
             )
             pre_refi_max = st.slider(
-                t("max_rate", lang), 0.03, 0.30, pre_d[2], 0.001, key="pre_refi_max", format="%.3f"
+                T["max_rate"], 0.03, 0.30, pre_d[2], 0.001, key="pre_refi_max", format="%.3f"
             )
             pre_refi_rate = (pre_refi_min, pre_refi_mode, pre_refi_max)
 
-        with st.expander(t("post_refi_rates", lang)):
+        with st.expander(T["post_refi_rates"]):
             post_refi_min = st.slider(
-                t("min_rate", lang),
+                T["min_rate"],
                 0.005,
                 0.10,
                 post_d[0],
@@ -814,7 +880,7 @@ def main():
                 format="%.3f",
             )
             post_refi_mode = st.slider(
-                t("mode_rate", lang),
+                T["mode_rate"],
                 0.005,
                 0.12,
                 post_d[1],
@@ -823,7 +889,7 @@ def main():
                 format="%.3f",
             )
             post_refi_max = st.slider(
-                t("max_rate", lang),
+                T["max_rate"],
                 0.005,
                 0.15,
                 post_d[2],
@@ -836,94 +902,108 @@ def main():
         st.markdown("---")
 
         # Timeline Parameters
-        st.subheader("⏱️ " + t("timeline", lang))
+        st.subheader("⏱️ " + T["timeline"])
 
-        with st.expander(t("project_timeline", lang)):
+        with st.expander(T["project_timeline"]):
             completion_target_month = st.slider(
-                t("completion_target", lang),
+                T["completion_target"],
                 min_value=6,
                 max_value=30,
                 value=16,
                 step=1,
-                help=t("completion_help", lang),
+                help=T["completion_help"],
             )
 
             demand_driver_opening_month = st.slider(
-                t("demand_driver_opening", lang),
+                T["demand_driver_opening"],
                 min_value=completion_target_month + 2,
                 max_value=48,
                 value=max(24, completion_target_month + 2),
                 step=1,
-                help=t("demand_driver_opening_help", lang),
+                help=T["demand_driver_opening_help"],
             )
 
             exit_month = st.slider(
-                t("exit_month", lang),
+                T["exit_month"],
                 min_value=demand_driver_opening_month + 2,
                 max_value=60,
                 value=max(36, demand_driver_opening_month + 2),
                 step=1,
-                help=t("exit_help", lang),
+                help=T["exit_help"],
             )
 
             # Visual timeline summary
             st.markdown(f"""
-            **{t("timeline_summary", lang)}**
-            - {t("construction", lang)}: 0 → {completion_target_month}{t("months_unit", lang)}
-            - {t("stabilization", lang)}: {completion_target_month} → {demand_driver_opening_month}{t("months_unit", lang)}
-            - {t("post_opening_phase", lang)}: {demand_driver_opening_month} → {exit_month}{t("months_unit", lang)}
-            - **{t("total_duration", lang)}**: {exit_month}{t("months_unit", lang)}
+            **{T["timeline_summary"]}**
+            - {T["construction"]}: 0 → {completion_target_month}{T["months_unit"]}
+            - {T["stabilization"]}: {completion_target_month} → {demand_driver_opening_month}{T["months_unit"]}
+            - {T["post_opening_phase"]}: {demand_driver_opening_month} → {exit_month}{T["months_unit"]}
+            - **{T["total_duration"]}**: {exit_month}{T["months_unit"]}
             """)
 
         st.markdown("---")
 
-        run_pressed = st.button(t("run_simulation", lang), type="primary", width="stretch")
+        run_pressed = st.button(T["run_simulation"], type="primary", width="stretch")
 
     # Main Content Area
     # 1. Execute Simulation Data
     if run_pressed:
         # Guard: np.random.triangular raises if min > mode or mode > max.
         triangles = {
-            t("stabilization_phase", lang): stabilization_revenue_dist,
-            t("post_opening", lang): post_opening_revenue_dist,
-            t("pre_refi_rates", lang): pre_refi_rate,
-            t("post_refi_rates", lang): post_refi_rate,
+            T["stabilization_phase"]: stabilization_revenue_dist,
+            T["post_opening"]: post_opening_revenue_dist,
+            T["pre_refi_rates"]: pre_refi_rate,
+            T["post_refi_rates"]: post_refi_rate,
         }
         invalid = [name for name, (lo, mode, hi) in triangles.items() if not lo <= mode <= hi]
         if invalid:
-            st.error(t("invalid_triangle", lang).format(", ".join(invalid)))
+            st.error(T["invalid_triangle"].format(", ".join(invalid)))
             st.stop()
 
-        config_dict = {
-            "initial_equity": initial_equity,
-            "senior_loan": senior_loan,
-            "monthly_fixed_cost": monthly_fixed_cost,
-            "stabilization_revenue_dist": stabilization_revenue_dist,
-            "post_opening_revenue_dist": post_opening_revenue_dist,
-            "pre_refi_rate": pre_refi_rate,
-            "post_refi_rate": post_refi_rate,
-            "completion_target_month": completion_target_month,
-            "demand_driver_opening_month": demand_driver_opening_month,
-            "exit_month": exit_month,
-            "config_type": "Interactive Dashboard",
-            "display_currency": currency_display,
-        }
-
-        with st.spinner(t("running", lang).format(iterations)):
-            start_time = time.time()
+        config = PFConfig(
+            initial_equity=initial_equity,
+            senior_loan=senior_loan,
+            monthly_fixed_cost=monthly_fixed_cost,
+            stabilization_revenue_dist=stabilization_revenue_dist,
+            post_opening_revenue_dist=post_opening_revenue_dist,
+            pre_refi_rate=pre_refi_rate,
+            post_refi_rate=post_refi_rate,
+            completion_target_month=completion_target_month,
+            demand_driver_opening_month=demand_driver_opening_month,
+            exit_month=exit_month,
+            config_type="Interactive Dashboard",
+            display_currency=currency_display,
+        )
 
-            # Run and save to session state
-            df = run_simulation_cached(config_dict, iterations, seed)
-            st.session_state["df"] = df
-            st.session_state["has_run"] = True
-            st.session_state["result_context"] = {
-                "initial_equity": initial_equity,
-                "use_normalized": use_normalized,
-                "exit_month": exit_month,
-            }
+        # Identical inputs keep the stored result: no cache lookup, no copy.
+        result_key = (_config_cache_key(config), iterations, seed)
+        if st.session_state.get("result_key") != result_key:
+            with st.status(T["running"].format(iterations), expanded=False) as run_status:
+                start_time = time.time()
+
+                # Run and save to session state, with the derived chart arrays
+                df, computed_at = run_simulation_cached(config, iterations, seed)
+                st.session_state["df"] = df
+                st.session_state["result_arrays"] = result_arrays(df)
+                st.session_state["result_key"] = result_key
+                st.session_state["result_figures"] = {}
+                st.session_state["result_csv"] = None
+                st.session_state["result_revision"] = (
+                    st.session_state.get("result_revision", 0) + 1
+                )
+                st.session_state["result_context"] = {
+                    "initial_equity": initial_equity,
+                    "use_normalized": use_normalized,
+                    "exit_month": exit_month,
+                }
 
-            elapsed_time = time.time() - start_time
-            st.success(t("completed", lang).format(elapsed_time))
+                # A cache hit has no meaningful run time to report
+                if computed_at >= start_time:
+                    label = T["completed"].format(time.time() - start_time)
+                else:
+                    label = T["loaded_cached"]
+                run_status.update(label=label, state="complete")
+        st.session_state["has_run"] = True
 
     # 2. Display Results (keeps UI alive across button clicks)
     if st.session_state.get("has_run", False) and st.session_state.get("df") is not None:
@@ -943,19 +1023,20 @@ def main():
         st.markdown("---")
 
         # Key Metrics Row
-        st.subheader(t("key_metrics", lang))
+        st.subheader(T["key_metrics"])
 
         # Initialize base case in session state
         if "base_case" not in st.session_state:
             st.session_state["base_case"] = None
 
         # Calculate current metrics
-        exit_prob = len(df[df["status"] == "exit"]) / len(df) * 100
-        default_prob = len(df[df["status"] == "default"]) / len(df) * 100
-        refi_fail_prob = len(df[df["status"] == "refi_fail"]) / len(df) * 100
+        # One bincount over the stored status codes instead of a scan per status
+        arrays = st.session_state["result_arrays"]
+        shares = np.bincount(arrays["codes"], minlength=len(STATUS_LABELS)) / len(df) * 100
+        exit_prob, default_prob, refi_fail_prob = shares[EXIT], shares[DEFAULT], shares[REFI_FAIL]
 
-        exit_df = df[df["status"] == "exit"]
-        median_irr = exit_df["irr"].median() if not exit_df.empty else 0
+        # Exit statistics read the per-column exit arrays split once per run
+        median_irr = float(np.median(arrays["exit_irr"])) if arrays["exit_irr"].size else 0
 
         loss_metrics = equity_loss_metrics(df, result_initial_equity)
         var_95 = loss_metrics["var_95_pct"]
@@ -964,8 +1045,8 @@ def main():
         _col_base1, col_base2, col_base3 = st.columns([2, 1, 1])
         with col_base2:
             if st.button(
-                "📌 " + t("set_base", lang),
-                help=t("set_base_help", lang),
+                "📌 " + T["set_base"],
+                help=T["set_base_help"],
                 width="stretch",
             ):
                 st.session_state["base_case"] = {
@@ -976,11 +1057,11 @@ def main():
                     "var_95": var_95,
                 }
                 # Use toast instead of success so the message survives the rerun!
-                st.toast(t("base_set", lang), icon="✅")
+                st.toast(T["base_set"], icon="✅")
                 st.rerun()
 
         with col_base3:
-            if st.session_state["base_case"] and st.button(t("reset_base", lang), width="stretch"):
+            if st.session_state["base_case"] and st.button(T["reset_base"], width="stretch"):
                 st.session_state["base_case"] = None
                 st.rerun()
 
@@ -991,67 +1072,69 @@ def main():
             base = st.session_state["base_case"]
 
             col1.metric(
-                t("exit_success", lang),
+                T["exit_success"],
                 f"{exit_prob:.1f}%",
                 delta=f"{exit_prob - base['exit_prob']:.1f}%",
             )
             col2.metric(
-                t("default_rate", lang),
+                T["default_rate"],
                 f"{default_prob:.1f}%",
                 delta=f"{default_prob - base['default_prob']:.1f}%",
                 delta_color="inverse",
             )
             col3.metric(
-                t("refi_failure", lang),
+                T["refi_failure"],
                 f"{refi_fail_prob:.1f}%",
                 delta=f"{refi_fail_prob - base['refi_fail_prob']:.1f}%",
                 delta_color="inverse",
             )
             col4.metric(
-                t("median_irr", lang),
+                T["median_irr"],
                 f"{median_irr:.1%}",
                 delta=f"{(median_irr - base['median_irr']):.1%}",
             )
             col5.metric(
-                t("var_95", lang),
+                T["var_95"],
                 f"{var_95:.1f}%",
                 delta=f"{var_95 - base['var_95']:.1f}%",
                 delta_color="inverse",
             )
         else:
             # No base case - show without delta
-            col1.metric(t("exit_success", lang), f"{exit_prob:.1f}%")
-            col2.metric(t("default_rate", lang), f"{default_prob:.1f}%")
-            col3.metric(t("refi_failure", lang), f"{refi_fail_prob:.1f}%")
-            col4.metric(t("median_irr", lang), f"{median_irr:.1%}")
-            col5.metric(t("var_95", lang), f"{var_95:.1f}%")
+            col1.metric(T["exit_success"], f"{exit_prob:.1f}%")
+            col2.metric(T["default_rate"], f"{default_prob:.1f}%")
+            col3.metric(T["refi_failure"], f"{refi_fail_prob:.1f}%")
+            col4.metric(T["median_irr"], f"{median_irr:.1%}")
+            col5.metric(T["var_95"], f"{var_95:.1f}%")
 
         st.markdown("---")
 
         # Display refinancing analysis section
-        st.subheader(t("refi_analysis", lang))
+        st.subheader(T["refi_analysis"])
 
         # Filter scenarios that successfully survived until the refinancing month
-        refi_cases = df[df["principal_at_refi"] > 0].copy()
+        # (plain column arrays; defaulted paths carry NaN and drop out here)
+        principal_at_refi = df["principal_at_refi"].to_numpy()
+        reached_refi = principal_at_refi > 0
 
-        if not refi_cases.empty:
+        if reached_refi.any():
             # Calculate the individual gap for each simulation path
             # Shortfall = Debt at Refi - Maximum Loan Limit
-            refi_cases["shortfall"] = (
-                refi_cases["principal_at_refi"] - refi_cases["refi_loan_amount"]
+            shortfall = (
+                principal_at_refi[reached_refi] - df["refi_loan_amount"].to_numpy()[reached_refi]
             )
 
-            # Filter ONLY the paths where refinancing failed (Shortfall > 0)
-            failed_refi_cases = refi_cases[refi_cases["shortfall"] > 0]
+            # Keep ONLY the paths where refinancing failed (Shortfall > 0)
+            failed_shortfall = shortfall[shortfall > 0]
 
-            if not failed_refi_cases.empty:
+            if failed_shortfall.size:
                 # Calculate Conditional Mean (Expected Shortfall)
-                expected_shortfall = failed_refi_cases["shortfall"].mean()
-                failure_rate = (len(failed_refi_cases) / len(refi_cases)) * 100
+                expected_shortfall = failed_shortfall.mean()
+                failure_rate = (failed_shortfall.size / shortfall.size) * 100
 
                 # Format currency based on user selection
                 if result_use_normalized:
-                    val_es = f"{expected_shortfall:.1f} {t('index', lang)}"
+                    val_es = f"{expected_shortfall:.1f} {T['index']}"
                 else:
                     if lang == "en":
                         divisor = 1e9
@@ -1061,127 +1144,128 @@ def main():
                         fmt = ",.0f"
                     val_num = expected_shortfall / divisor
 
-                    val_es = f"{val_num:{fmt}} {t('currency_unit', lang)}"
+                    val_es = f"{val_num:{fmt}} {T['currency_unit']}"
 
                 # Render metrics
                 col_refi1, col_refi2 = st.columns(2)
 
-                col_refi1.metric(label=t("refi_failure_rate", lang), value=f"{failure_rate:.1f}%")
+                col_refi1.metric(label=T["refi_failure_rate"], value=f"{failure_rate:.1f}%")
 
                 col_refi2.metric(
-                    label=t("expected_shortfall", lang),
+                    label=T["expected_shortfall"],
                     value=val_es,
-                    delta=t("capital_injection", lang),
+                    delta=T["capital_injection"],
                     delta_color="inverse",
                 )
             else:
                 # Handled all refinancing successfully
-                st.success(t("no_shortfall", lang))
+                st.success(T["no_shortfall"])
         else:
             # Defaulted before reaching the refinancing phase
-            st.warning(t("no_refi_reached", lang))
+            st.warning(T["no_refi_reached"])
 
         st.markdown("---")
 
         # Visualizations - 2x2 Grid
+        # Figures are built once per (result, language) and reused on later
+        # reruns; a language toggle builds each language's set only once.
+        figures = st.session_state["result_figures"]
+        if lang not in figures:
+            figures[lang] = build_figures(
+                arrays, lang, result_exit_month, st.session_state["result_revision"]
+            )
+        figs = figures[lang]
         col1, col2 = st.columns(2)
 
         with col1:
-            st.plotly_chart(create_outcome_chart(df, lang), width="stretch", key="chart_outcome")
-            st.plotly_chart(
-                create_survival_curve(df, lang, result_exit_month),
-                width="stretch",
-                key="chart_survival",
-            )
+            st.plotly_chart(figs["outcome"], width="stretch", key="chart_outcome")
+            st.plotly_chart(figs["survival"], width="stretch", key="chart_survival")
 
         with col2:
-            st.plotly_chart(create_irr_histogram(df, lang), width="stretch", key="chart_irr")
-            st.plotly_chart(
-                create_exit_multiple_chart(df, lang), width="stretch", key="chart_multiple"
-            )
+            st.plotly_chart(figs["irr"], width="stretch", key="chart_irr")
+            st.plotly_chart(figs["multiple"], width="stretch", key="chart_multiple")
 
         st.markdown("---")
 
         # Detailed Statistics Table
-        st.subheader(t("detailed_stats", lang))
+        st.subheader(T["detailed_stats"])
 
-        tab1, tab2, tab3 = st.tabs(
-            [t("return_metrics", lang), t("risk_metrics", lang), t("raw_data", lang)]
-        )
+        tab1, tab2, tab3 = st.tabs([T["return_metrics"], T["risk_metrics"], T["raw_data"]])
 
         with tab1:
-            if not exit_df.empty:
+            if arrays["exit_irr"].size:
                 col1, col2 = st.columns(2)
 
                 with col1:
-                    st.markdown(f"**{t('irr_statistics', lang)}**")
+                    st.markdown(f"**{T['irr_statistics']}**")
+                    irr_stats = distribution_summary(arrays["exit_irr"])
 
                     irr_data = {
-                        t("metric", lang): [
-                            t("sample_size", lang),
-                            t("mean", lang),
-                            t("median", lang),
-                            t("std_dev", lang),
-                            t("min", lang),
-                            t("max", lang),
-                            t("percentile_25", lang),
-                            t("percentile_75", lang),
-                            t("iqr", lang),
+                        T["metric"]: [
+                            T["sample_size"],
+                            T["mean"],
+                            T["median"],
+                            T["std_dev"],
+                            T["min"],
+                            T["max"],
+                            T["percentile_25"],
+                            T["percentile_75"],
+                            T["iqr"],
                         ],
-                        t("value", lang): [
-                            f"{len(exit_df):,} {t('exits', lang)}",
-                            f"{exit_df['irr'].mean():.2%}",
-                            f"{exit_df['irr'].median():.2%}",
-                            f"{exit_df['irr'].std():.2%}",
-                            f"{exit_df['irr'].min():.2%}",
-                            f"{exit_df['irr'].max():.2%}",
-                            f"{exit_df['irr'].quantile(0.25):.2%}",
-                            f"{exit_df['irr'].quantile(0.75):.2%}",
-                            f"{exit_df['irr'].quantile(0.75) - exit_df['irr'].quantile(0.25):.2%}",
+                        T["value"]: [
+                            f"{irr_stats['count']:,} {T['exits']}",
+                            f"{irr_stats['mean']:.2%}",
+                            f"{irr_stats['median']:.2%}",
+                            f"{irr_stats['std']:.2%}",
+                            f"{irr_stats['min']:.2%}",
+                            f"{irr_stats['max']:.2%}",
+                            f"{irr_stats['q25']:.2%}",
+                            f"{irr_stats['q75']:.2%}",
+                            f"{irr_stats['q75'] - irr_stats['q25']:.2%}",
                         ],
                     }
                     st.dataframe(pd.DataFrame(irr_data), width="stretch", hide_index=True)
 
                 with col2:
-                    if "exit_multiple" in exit_df.columns:
-                        st.markdown(f"**{t('exit_multiple_stats', lang)}**")
-
-                        mult_data = {
-                            t("metric", lang): [
-                                t("sample_size", lang),
-                                t("mean", lang),
-                                t("median", lang),
-                                t("std_dev", lang),
-                                t("min", lang),
-                                t("max", lang),
-                                t("percentile_25", lang),
-                                t("percentile_75", lang),
-                                t("iqr", lang),
-                            ],
-                            t("value", lang): [
-                                f"{len(exit_df):,} {t('exits', lang)}",
-                                f"{exit_df['exit_multiple'].mean():.2f}x",
-                                f"{exit_df['exit_multiple'].median():.2f}x",
-                                f"{exit_df['exit_multiple'].std():.2f}x",
-                                f"{exit_df['exit_multiple'].min():.2f}x",
-                                f"{exit_df['exit_multiple'].max():.2f}x",
-                                f"{exit_df['exit_multiple'].quantile(0.25):.2f}x",
-                                f"{exit_df['exit_multiple'].quantile(0.75):.2f}x",
-                                f"{exit_df['exit_multiple'].quantile(0.75) - exit_df['exit_multiple'].quantile(0.25):.2f}x",
-                            ],
-                        }
-                        st.dataframe(pd.DataFrame(mult_data), width="stretch", hide_index=True)
+                    st.markdown(f"**{T['exit_multiple_stats']}**")
+                    mult_stats = distribution_summary(arrays["exit_mult"])
+
+                    mult_data = {
+                        T["metric"]: [
+                            T["sample_size"],
+                            T["mean"],
+                            T["median"],
+                            T["std_dev"],
+                            T["min"],
+                            T["max"],
+                            T["percentile_25"],
+                            T["percentile_75"],
+                            T["iqr"],
+                        ],
+                        T["value"]: [
+                            f"{mult_stats['count']:,} {T['exits']}",
+                            f"{mult_stats['mean']:.2f}x",
+                            f"{mult_stats['median']:.2f}x",
+                            f"{mult_stats['std']:.2f}x",
+                            f"{mult_stats['min']:.2f}x",
+                            f"{mult_stats['max']:.2f}x",
+                            f"{mult_stats['q25']:.2f}x",
+                            f"{mult_stats['q75']:.2f}x",
+                            f"{mult_stats['q75'] - mult_stats['q25']:.2f}x",
+                        ],
+                    }
+                    st.dataframe(pd.DataFrame(mult_data), width="stretch", hide_index=True)
             else:
-                st.warning(t("no_exits", lang))
+                st.warning(T["no_exits"])
 
         with tab2:
             col1, col2 = st.columns(2)
 
             with col1:
-                st.markdown(f"**{t('var_metrics', lang)}**")
+                st.markdown(f"**{T['var_metrics']}**")
                 var_data = {
-                    t("confidence_level", lang): ["90%", "95%", "99%"],
-                    f"VaR (% {t('of_equity', lang)})": [
+                    T["confidence_level"]: ["90%", "95%", "99%"],
+                    f"VaR (% {T['of_equity']})": [
                         f"{loss_metrics['var_90_pct']:.1f}%",
                         f"{loss_metrics['var_95_pct']:.1f}%",
                         f"{loss_metrics['var_99_pct']:.1f}%",
@@ -1190,22 +1274,24 @@ def main():
                 st.dataframe(pd.DataFrame(var_data), width="stretch", hide_index=True)
 
             with col2:
-                st.markdown(f"**{t('additional_risk', lang)}**")
+                st.markdown(f"**{T['additional_risk']}**")
                 expected_loss = loss_metrics["expected_loss_pct"]
 
-                if len(exit_df) > 0 and exit_df["irr"].std() > 0:
-                    sharpe = exit_df["irr"].mean() / exit_df["irr"].std()
+                exit_irr = arrays["exit_irr"]
+                irr_std = exit_irr.std(ddof=1) if exit_irr.size > 1 else 0.0
+                if irr_std > 0:
+                    sharpe = exit_irr.mean() / irr_std
                 else:
                     sharpe = 0
 
                 risk_metrics = {
-                    t("metric", lang): [
-                        t("expected_loss", lang),
-                        t("sharpe_ratio", lang),
-                        t("success_rate", lang),
+                    T["metric"]: [
+                        T["expected_loss"],
+                        T["sharpe_ratio"],
+                        T["success_rate"],
                     ],
-                    t("value", lang): [
-                        f"{expected_loss:.1f}% {t('of_equity', lang)}",
+                    T["value"]: [
+                        f"{expected_loss:.1f}% {T['of_equity']}",
                         f"{sharpe:.2f}",
                         f"{exit_prob:.1f}%",
                     ],
@@ -1213,25 +1299,27 @@ def main():
                 st.dataframe(pd.DataFrame(risk_metrics), width="stretch", hide_index=True)
 
         with tab3:
-            st.markdown(f"**{t('simulation_results', lang)}**")
+            st.markdown(f"**{T['simulation_results']}**")
             st.dataframe(df.head(100), width="stretch")
 
-            csv = df.to_csv(index=False)
+            # Serialized once per result, not on every rerun
+            if st.session_state["result_csv"] is None:
+                st.session_state["result_csv"] = results_csv(df)
             st.download_button(
-                label=t("download_csv", lang),
-                data=csv,
+                label=T["download_csv"],
+                data=st.session_state["result_csv"],
                 file_name="pf_simulation_results.csv",
                 mime="text/csv",
             )
 
     else:
-        st.info(t("adjust_params", lang))
+        st.info(T["adjust_params"])
 
-        st.markdown(f"### {t('instructions_title', lang)}")
-        st.markdown(t("instructions", lang))
+        st.markdown(f"### {T['instructions_title']}")
+        st.markdown(T["instructions"])
 
-        st.markdown(f"### {t('key_features', lang)}")
-        st.markdown(t("features", lang))
+        st.markdown(f"### {T['key_features']}")
+        st.markdown(T["features"])
 
 
 if __name__ == "__main__":
@@ -3,14 +3,15 @@ PF Configuration Data Model
 Separated to avoid circular imports between engine.py and config files.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PFConfig:
     """
     Configuration for Real Estate PF Investment Monte Carlo Simulation.
     Encapsulates all financial parameters and stochastic distributions.
+    Immutable: derive scenario variants with dataclasses.replace().
     """
 
     # Capital Structure (normalized units)
@@ -59,14 +60,15 @@ class PFConfig:
     # refinancing (distressed / time-constrained disposal).
     distress_sale_discount: float = 0.10
 
+    # Share of monthly interest capitalized into principal, per phase
+    cap_ratio_construction: float = 1.0  # Full interest capitalization during building
+    cap_ratio_stabilization: float = 0.4  # Partial capitalization during ramp-up
+    cap_ratio_exit: float = 0.0  # No capitalization post-opening
+
     # Metadata for display
     config_type: str = "unknown"
     display_currency: str = "Index"
 
-    # Internal mapping for interest capitalization ratios
-    # Defined in __post_init__ to avoid type check errors with default values.
-    capitalized_ratio_map: dict[str, float] = field(default_factory=dict, init=False)
-
     def __post_init__(self):
         if self.initial_equity <= 0:
             raise ValueError("initial_equity must be positive")
@@ -76,12 +78,13 @@ class PFConfig:
             raise ValueError("monthly_fixed_cost cannot be negative")
         if self.cap_rate <= 0:
             raise ValueError("cap_rate must be positive")
-
-        self.capitalized_ratio_map = {
-            "construction": 1.0,  # Full interest capitalization during building
-            "stabilization": 0.4,  # Partial capitalization during ramp-up
-            "exit": 0.0,  # No capitalization post-opening
-        }
+        for ratio in (
+            self.cap_ratio_construction,
+            self.cap_ratio_stabilization,
+            self.cap_ratio_exit,
+        ):
+            if not 0 <= ratio <= 1:
+                raise ValueError("cap_ratio_* must lie in [0, 1]")
 
     @property
     def stabilization_noi_dist(self) -> tuple[float, float, float]:
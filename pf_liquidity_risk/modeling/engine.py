@@ -1,3 +1,15 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+import threading
+
+import matplotlib
+
+# Figures are only ever saved to file, so skip interactive backend discovery
+# unless the environment (e.g. a Jupyter kernel) has chosen one.
+if "MPLBACKEND" not in os.environ:
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
@@ -6,6 +18,7 @@ from pf_liquidity_risk.config import FIGURES_DIR
 
 # Import config model (no circular dependency)
 from pf_liquidity_risk.modeling.config_model import PFConfig
+from pf_liquidity_risk.reporting import distribution_summary, survival_curve
 
 # Use the public (normalized/illustrative) config by default. A local, optional
 # private_config.py (gitignored) can override it for internal use.
@@ -23,6 +36,11 @@ except ImportError:
 # Simulation Engine
 # ==========================================
 
+# Integer outcome codes used by the vectorized engine. Labels are attached
+# once, when the result frame is assembled.
+EXIT, DEFAULT, REFI_FAIL, SURVIVED_NO_EXIT = 0, 1, 2, 3
+STATUS_LABELS = np.array(["exit", "default", "refi_fail", "survived_no_exit"])
+
 
 class PFInvestmentModel:
     """
@@ -40,53 +58,91 @@ class PFInvestmentModel:
         """Cap annualized NOI; a non-positive NOI cannot imply a negative value."""
         return max(0.0, monthly_noi * 12 / self.cfg.cap_rate)
 
-    def simulate_path(self) -> dict:
-        equity = self.cfg.initial_equity
-        principal = self.cfg.senior_loan
-        noi_history: list[float] = []
+    def draw_shocks(self, n: int) -> dict[str, np.ndarray]:
+        """
+        Pre-draw every stochastic input for n paths: one Generator call per
+        field instead of one scalar call per field per path. Row i of each
+        array holds the draws of path i for simulate_path / simulate_batch.
+        """
+        if n < 0:
+            raise ValueError("n cannot be negative")
+        cfg = self.cfg
+        return {
+            "pre_refi_rate": self.rng.triangular(*cfg.pre_refi_rate, size=n),
+            "post_refi_rate": self.rng.triangular(*cfg.post_refi_rate, size=n),
+            "stabilization_noi": self.rng.triangular(*cfg.stabilization_noi_dist, size=n),
+            "post_opening_noi": self.rng.triangular(*cfg.post_opening_noi_dist, size=n),
+            "delay_months": self.rng.triangular(0, 2, 6, size=n).astype(np.int64),
+            "refi_ltv_limit": self.rng.triangular(*cfg.target_refi_ltv_dist, size=n),
+            "distress_cost_rate": self.rng.uniform(*cfg.exit_cost_range, size=n),
+            "exit_cost_rate": self.rng.uniform(*cfg.exit_cost_range, size=n),
+        }
+
+    def simulate_path(self, shocks: dict[str, np.ndarray] | None = None, i: int = 0) -> dict:
+        """
+        Simulate one path. With pre-drawn shocks (see draw_shocks) the path
+        reads row i; otherwise it draws its own single row.
+        """
+        if shocks is None:
+            shocks, i = self.draw_shocks(1), 0
+
+        # Loop-invariant config, unpacked once into primitives: the month loop
+        # then reads locals instead of chasing self.cfg attributes.
+        cfg = self.cfg
+        initial_equity = cfg.initial_equity
+        fixed_cost = cfg.monthly_fixed_cost
+        exit_month = cfg.exit_month
+        opening_month = cfg.demand_driver_opening_month
+        delay_cost_factor = cfg.delay_cost_factor
+        cap_construction = cfg.cap_ratio_construction
+        cap_stabilization = cfg.cap_ratio_stabilization
+        cap_exit = cfg.cap_ratio_exit
+        share = cfg.lease_up_initial_share
+        n_ramp = max(1, cfg.stabilization_ramp_months - 1)
+
+        equity = initial_equity
+        principal = cfg.senior_loan
+        # NOI of the last three months (oldest first): all the refi gate reads
+        noi_lag2 = noi_lag1 = noi_cur = 0.0
 
         principal_at_refi = 0.0
         refi_loan_amount = 0.0
 
-        # Sample rates
-        pre_refi_rate = self.rng.triangular(*self.cfg.pre_refi_rate)
-        post_refi_rate = self.rng.triangular(*self.cfg.post_refi_rate)
+        # Sampled rates and NOI levels
+        pre_refi_rate = shocks["pre_refi_rate"][i]
+        post_refi_rate = shocks["post_refi_rate"][i]
 
-        sampled_stab_noi = self.rng.triangular(*self.cfg.stabilization_noi_dist)
-        sampled_post_noi = self.rng.triangular(*self.cfg.post_opening_noi_dist)
+        sampled_stab_noi = shocks["stabilization_noi"][i]
+        sampled_post_noi = shocks["post_opening_noi"][i]
 
-        completion_month = self.cfg.completion_target_month + int(self.rng.triangular(0, 2, 6))
-        delay = max(0, completion_month - self.cfg.completion_target_month)
+        completion_month = cfg.completion_target_month + int(shocks["delay_months"][i])
+        delay = max(0, completion_month - cfg.completion_target_month)
 
         refi_month = completion_month + 3
 
-        # Track refinancing status
-        current_rate = pre_refi_rate
+        # Monthly rate switches from pre- to post-refi once refinancing succeeds
+        monthly_rate = pre_refi_rate / 12
 
-        for m in range(1, self.cfg.exit_month + 1):
-            # Phase determination
+        for m in range(1, exit_month + 1):
+            # Phase determination (binds the phase's capitalized share directly)
             if m < completion_month:
-                phase, monthly_noi = "construction", 0
-            elif m < self.cfg.demand_driver_opening_month:
+                monthly_noi, cap_ratio = 0, cap_construction
+            elif m < opening_month:
                 # Lease-up ramp: anchor tenant floor from day 1, remaining
                 # floors ramp in linearly over stabilization_ramp_months
                 # (default 60% -> 80% -> 100%). Early sub-stabilized months
                 # drag down the trailing NOI at the refi gate ("Average Trap").
-                phase = "stabilization"
+                cap_ratio = cap_stabilization
                 months_open = m - completion_month  # 0-based
-                n_ramp = max(1, self.cfg.stabilization_ramp_months - 1)
-                share = self.cfg.lease_up_initial_share
                 ramp = min(1.0, share + (1 - share) * months_open / n_ramp)
                 monthly_noi = sampled_stab_noi * ramp
             else:
-                phase, monthly_noi = "exit", sampled_post_noi
+                monthly_noi, cap_ratio = sampled_post_noi, cap_exit
 
-            noi_history.append(monthly_noi)
+            noi_lag2, noi_lag1, noi_cur = noi_lag1, noi_cur, monthly_noi
 
             # Interest rate logic
-            monthly_rate = current_rate / 12
             interest = principal * monthly_rate
-            cap_ratio = self.cfg.capitalized_ratio_map[phase]
 
             paid_interest = interest * (1 - cap_ratio)
             principal += interest * cap_ratio
@@ -94,7 +150,7 @@ class PFInvestmentModel:
             # Sponsor-level cash flow and principal sweep. Property operating
             # expenses are already reflected in NOI; project overhead and
             # interest sit below NOI.
-            net_cash_flow = monthly_noi - (self.cfg.monthly_fixed_cost + paid_interest)
+            net_cash_flow = monthly_noi - (fixed_cost + paid_interest)
 
             if net_cash_flow > 0:
                 principal -= net_cash_flow
@@ -108,7 +164,7 @@ class PFInvestmentModel:
             # delay_cost_factor (default 0.6) assumes ~60% of monthly fixed cost
             # per delayed month is unrecoverable (idle crew, extended G&A).
             if m == completion_month and delay > 0:
-                equity -= delay * self.cfg.monthly_fixed_cost * self.cfg.delay_cost_factor
+                equity -= delay * fixed_cost * delay_cost_factor
 
             # Insolvency Check
             if equity <= 0:
@@ -116,11 +172,11 @@ class PFInvestmentModel:
 
             # Refinancing Viability Check (Month (Completion + 3))
             if m == refi_month:
-                ltv_limit = self.rng.triangular(*self.cfg.target_refi_ltv_dist)
+                ltv_limit = shocks["refi_ltv_limit"][i]
                 # Simple trailing 3-month average NOI, as lenders typically use.
                 # Because of the lease-up ramp, the early low-NOI months
                 # drag this average down (the "Average Trap").
-                rolling_noi = np.mean(noi_history[-3:])
+                rolling_noi = (noi_lag2 + noi_lag1 + noi_cur) / min(m, 3)
                 implied_val = self.income_approach_value(rolling_noi)
 
                 max_refi_loan = implied_val * ltv_limit
@@ -133,13 +189,13 @@ class PFInvestmentModel:
                     # Sponsor recovers any residual after debt repayment.
                     # (Loan extensions / fresh capital injections are NOT
                     # modeled — see README Limitations.)
-                    sale_val = implied_val * (1 - self.cfg.distress_sale_discount)
-                    sale_cost = sale_val * self.rng.uniform(*self.cfg.exit_cost_range)
+                    sale_val = implied_val * (1 - cfg.distress_sale_discount)
+                    sale_cost = sale_val * shocks["distress_cost_rate"][i]
                     recovery = max(0.0, sale_val - principal - sale_cost)
 
                     if recovery > 0:
                         years = m / 12
-                        irr = (recovery / self.cfg.initial_equity) ** (1 / years) - 1
+                        irr = (recovery / initial_equity) ** (1 / years) - 1
                     else:
                         irr = -1.0
 
@@ -153,19 +209,19 @@ class PFInvestmentModel:
                     }
                 else:
                     # Refinancing succeeded - switch to lower rate
-                    current_rate = post_refi_rate
+                    monthly_rate = post_refi_rate / 12
 
             # Final Exit Transaction
-            if m == self.cfg.exit_month:
+            if m == exit_month:
                 final_val = self.income_approach_value(monthly_noi)
-                exit_cost = final_val * self.rng.uniform(*self.cfg.exit_cost_range)
+                exit_cost = final_val * shocks["exit_cost_rate"][i]
                 exit_equity = final_val - principal - exit_cost
 
                 if exit_equity > 0:
                     # Annualized return on equity. With a single equity outflow at
                     # t0 and a single payout at exit (no interim distributions),
                     # this CAGR equals the IRR of that cash-flow profile.
-                    total_return = exit_equity / self.cfg.initial_equity
+                    total_return = exit_equity / initial_equity
                     years = m / 12
                     irr = (total_return ** (1 / years)) - 1
                 else:
@@ -176,38 +232,530 @@ class PFInvestmentModel:
                     "month": m,
                     "final_equity": max(0, exit_equity),
                     "irr": irr,
-                    "exit_multiple": exit_equity / self.cfg.initial_equity
-                    if exit_equity > 0
-                    else 0,
+                    "exit_multiple": exit_equity / initial_equity if exit_equity > 0 else 0,
                     "principal_at_refi": principal_at_refi,
                     "refi_loan_amount": refi_loan_amount,
                 }
 
         return {
             "status": "survived_no_exit",
-            "month": self.cfg.exit_month,
+            "month": exit_month,
             "final_equity": equity,
             "irr": 0.0,
             "principal_at_refi": principal_at_refi,
             "refi_loan_amount": refi_loan_amount,
         }
 
+    def simulate_batch(self, n: int, shocks: dict[str, np.ndarray] | None = None) -> pd.DataFrame:
+        """
+        Vectorized equivalent of simulate_path for n independent paths.
+        All paths advance together month by month as NumPy arrays; a path that
+        defaults, fails refinancing or exits is frozen by the `active` mask,
+        and ended paths are periodically compacted out of the working arrays.
+        Returns one row per path with the same columns as simulate_path.
+        """
+        if shocks is None:
+            shocks = self.draw_shocks(n)
+        elif len(shocks["pre_refi_rate"]) != n:
+            raise ValueError("shocks must hold exactly n rows")
+
+        cfg = self.cfg
+        n_months = cfg.exit_month
+
+        pre_refi_rate = shocks["pre_refi_rate"]
+        post_refi_rate = shocks["post_refi_rate"]
+        sampled_stab_noi = shocks["stabilization_noi"]
+        sampled_post_noi = shocks["post_opening_noi"]
+        delay = shocks["delay_months"]
+        ltv_limit = shocks["refi_ltv_limit"]
+        sale_cost_rate = shocks["distress_cost_rate"]
+        exit_cost_rate = shocks["exit_cost_rate"]
+
+        completion_month = cfg.completion_target_month + delay
+        refi_month = completion_month + 3
+
+        # Working arrays hold the live paths only; rows maps them to outputs
+        rows = np.arange(n)
+        equity = np.full(n, cfg.initial_equity, dtype=np.float64)
+        principal = np.full(n, cfg.senior_loan, dtype=np.float64)
+        monthly_rate = pre_refi_rate / 12
+        # Rolling NOI window for the refi gate: month m is stored in row m % 3
+        noi_window = np.zeros((3, n))
+        active = np.ones(n, dtype=bool)
+
+        # Per-path outputs. Missing keys of the dict-based path become NaN.
+        status = np.full(n, SURVIVED_NO_EXIT, dtype=np.int8)
+        month = np.full(n, n_months, dtype=np.int64)
+        final_equity = np.zeros(n)
+        irr = np.zeros(n)
+        exit_multiple = np.full(n, np.nan)
+        principal_at_refi = np.zeros(n)
+        refi_loan_amount = np.zeros(n)
+
+        # Scratch buffers reused every month: the loop updates state in place
+        # instead of allocating fresh n-sized temporaries per operation.
+        ramp = np.empty(n)
+        monthly_noi = np.empty(n)
+        cap_ratio = np.empty(n)
+        interest = np.empty(n)
+        paid_interest = np.empty(n)
+        net_cash_flow = np.empty(n)
+
+        n_ramp = max(1, cfg.stabilization_ramp_months - 1)
+        share = cfg.lease_up_initial_share
+
+        # Phase code per path (0 construction, 1 stabilization, 2 post-opening)
+        # from two compares; the cap ratio is then a gather, not masked writes.
+        phase = np.empty(n, dtype=np.intp)
+        started = np.empty(n)
+        cap_by_phase = np.array(
+            [cfg.cap_ratio_construction, cfg.cap_ratio_stabilization, cfg.cap_ratio_exit]
+        )
+
+        for m in range(1, n_months + 1):
+            # Phase determination (see simulate_path for the lease-up ramp).
+            # The opening month is shared by all paths, so only completion
+            # differs per path: NOI is the phase's level times 0/1 `started`.
+            opened = m >= cfg.demand_driver_opening_month
+            np.greater_equal(m, completion_month, out=phase, casting="unsafe")
+            np.copyto(started, phase)
+            if opened:
+                phase *= 2
+                np.multiply(sampled_post_noi, started, out=monthly_noi)
+            else:
+                np.multiply(1 - share, m - completion_month, out=ramp)
+                np.divide(ramp, n_ramp, out=ramp)
+                np.add(ramp, share, out=ramp)
+                np.minimum(ramp, 1.0, out=ramp)
+                np.multiply(sampled_stab_noi, ramp, out=monthly_noi)
+                monthly_noi *= started
+            noi_window[m % 3] = monthly_noi
+
+            # Interest rate logic
+            np.take(cap_by_phase, phase, out=cap_ratio)
+            np.multiply(principal, monthly_rate, out=interest)
+            np.subtract(1, cap_ratio, out=paid_interest)
+            np.multiply(paid_interest, interest, out=paid_interest)
+            np.multiply(interest, cap_ratio, out=interest)
+            principal += interest
+
+            # Sponsor-level cash flow and principal sweep
+            np.add(paid_interest, cfg.monthly_fixed_cost, out=net_cash_flow)
+            np.subtract(monthly_noi, net_cash_flow, out=net_cash_flow)
+            sweep = net_cash_flow > 0
+            np.add(equity, net_cash_flow, out=equity, where=~sweep)
+            np.subtract(principal, net_cash_flow, out=principal, where=sweep)
+            # A sweep larger than the outstanding debt flows back to equity
+            overpaid = principal < 0
+            np.subtract(equity, principal, out=equity, where=overpaid)
+            principal[overpaid] = 0.0
+
+            # Construction delay impact: one-time overhead shock on completion
+            delay_hit = (m == completion_month) & (delay > 0)
+            equity[delay_hit] -= delay[delay_hit] * cfg.monthly_fixed_cost * cfg.delay_cost_factor
+
+            # Insolvency Check
+            defaulted = active & (equity <= 0)
+            out = rows[defaulted]
+            status[out] = DEFAULT
+            month[out] = m
+            irr[out] = -1.0
+            principal_at_refi[out] = np.nan
+            refi_loan_amount[out] = np.nan
+            active &= ~defaulted
+
+            # Refinancing Viability Check (Month (Completion + 3))
+            at_refi = np.flatnonzero(active & (refi_month == m))
+            if at_refi.size:
+                # Summed oldest first, as in simulate_path
+                rolling_noi = (
+                    noi_window[(m + 1) % 3, at_refi]
+                    + noi_window[(m + 2) % 3, at_refi]
+                    + noi_window[m % 3, at_refi]
+                ) / min(m, 3)
+                implied_val = np.maximum(0.0, rolling_noi * 12 / cfg.cap_rate)
+                max_refi_loan = implied_val * ltv_limit[at_refi]
+                out = rows[at_refi]
+                principal_at_refi[out] = principal[at_refi]
+                refi_loan_amount[out] = max_refi_loan
+
+                failed = principal[at_refi] > max_refi_loan
+                fail_idx = at_refi[failed]
+                sale_val = implied_val[failed] * (1 - cfg.distress_sale_discount)
+                sale_cost = sale_val * sale_cost_rate[fail_idx]
+                recovery = np.maximum(0.0, sale_val - principal[fail_idx] - sale_cost)
+
+                out = rows[fail_idx]
+                status[out] = REFI_FAIL
+                month[out] = m
+                final_equity[out] = recovery
+                irr[out] = _annualized_irr(recovery, cfg.initial_equity, m)
+                active[fail_idx] = False
+
+                # Refinancing succeeded - switch to lower rate
+                ok_idx = at_refi[~failed]
+                monthly_rate[ok_idx] = post_refi_rate[ok_idx] / 12
+
+            # Once ended paths make up a quarter of the working arrays, drop
+            # them so the remaining months only compute live paths.
+            n_live = np.count_nonzero(active)
+            if n_live == 0:
+                break
+            if n_live < 0.75 * active.size:
+                keep = np.flatnonzero(active)
+                (
+                    rows,
+                    equity,
+                    principal,
+                    monthly_rate,
+                    completion_month,
+                    refi_month,
+                    delay,
+                    sampled_stab_noi,
+                    sampled_post_noi,
+                    post_refi_rate,
+                    ltv_limit,
+                    sale_cost_rate,
+                    exit_cost_rate,
+                ) = (
+                    a[keep]
+                    for a in (
+                        rows,
+                        equity,
+                        principal,
+                        monthly_rate,
+                        completion_month,
+                        refi_month,
+                        delay,
+                        sampled_stab_noi,
+                        sampled_post_noi,
+                        post_refi_rate,
+                        ltv_limit,
+                        sale_cost_rate,
+                        exit_cost_rate,
+                    )
+                )
+                noi_window = noi_window[:, keep]
+                active = np.ones(n_live, dtype=bool)
+                ramp, monthly_noi, cap_ratio, interest, paid_interest, net_cash_flow, started = (
+                    np.empty(n_live) for _ in range(7)
+                )
+                phase = np.empty(n_live, dtype=np.intp)
+
+        # Final Exit Transaction: one vector pass over the paths still live
+        # after the last month, valued on that month's NOI
+        if n_months and active.any():
+            exiting = np.flatnonzero(active)
+            last_noi = noi_window[n_months % 3, exiting]
+            final_val = np.maximum(0.0, last_noi * 12 / cfg.cap_rate)
+            exit_cost = final_val * exit_cost_rate[exiting]
+            exit_equity = final_val - principal[exiting] - exit_cost
+            payout = np.maximum(0.0, exit_equity)
+            positive = exit_equity > 0
+
+            out = rows[exiting]
+            status[out] = EXIT
+            final_equity[out] = payout
+            irr[out] = _annualized_irr(payout, cfg.initial_equity, n_months)
+            exit_multiple[out] = np.where(positive, exit_equity / cfg.initial_equity, 0.0)
+            active[exiting] = False
+
+        final_equity[rows[active]] = equity[active]
+
+        return _result_frame(
+            status, month, final_equity, irr, exit_multiple, principal_at_refi, refi_loan_amount
+        )
+
+    def _kernel_args(self, shocks: dict[str, np.ndarray]) -> tuple:
+        """Positional arguments of _simulate_paths: shock arrays, then config scalars."""
+        cfg = self.cfg
+        return (
+            shocks["pre_refi_rate"],
+            shocks["post_refi_rate"],
+            shocks["stabilization_noi"],
+            shocks["post_opening_noi"],
+            shocks["delay_months"],
+            shocks["refi_ltv_limit"],
+            shocks["distress_cost_rate"],
+            shocks["exit_cost_rate"],
+            float(cfg.initial_equity),
+            float(cfg.senior_loan),
+            float(cfg.monthly_fixed_cost),
+            int(cfg.completion_target_month),
+            int(cfg.demand_driver_opening_month),
+            int(cfg.exit_month),
+            float(cfg.lease_up_initial_share),
+            max(1, cfg.stabilization_ramp_months - 1),
+            float(cfg.cap_ratio_construction),
+            float(cfg.cap_ratio_stabilization),
+            float(cfg.cap_ratio_exit),
+            float(cfg.cap_rate),
+            float(cfg.distress_sale_discount),
+            float(cfg.delay_cost_factor),
+        )
+
+    def simulate_many(
+        self, n: int, shocks: dict[str, np.ndarray] | None = None, parallel: bool = True
+    ) -> pd.DataFrame:
+        """
+        Fastest available engine for n paths: the compiled Numba kernel when
+        numba is installed, simulate_batch otherwise. Same shocks, same frame.
+        parallel=False keeps the kernel single-threaded (e.g. in pool workers).
+        """
+        if not HAVE_NUMBA:
+            return self.simulate_batch(n, shocks)
+        if shocks is None:
+            shocks = self.draw_shocks(n)
+        elif len(shocks["pre_refi_rate"]) != n:
+            raise ValueError("shocks must hold exactly n rows")
+
+        # Threaded kernel only from the main thread: numba's workqueue layer
+        # hangs interpreter exit after a parallel launch from another thread
+        # (Streamlit runs scripts on worker threads).
+        kernel = _simulate_paths_kernel
+        if parallel and _NUM_THREADS > 1 and threading.current_thread() is threading.main_thread():
+            kernel = _simulate_paths_parallel
+        outputs = kernel(*self._kernel_args(shocks))
+        return _result_frame(*outputs)
+
+
+def _annualized_irr(payout: np.ndarray, initial_equity: float, m: int) -> np.ndarray:
+    """CAGR-style IRR of payouts at month m; -1.0 where nothing is recovered."""
+    irr = np.full(payout.shape, -1.0)
+    positive = payout > 0
+    irr[positive] = np.power(payout[positive] / initial_equity, 1 / (m / 12)) - 1
+    return irr
+
+
+def _result_frame(
+    status: np.ndarray,
+    month: np.ndarray,
+    final_equity: np.ndarray,
+    irr: np.ndarray,
+    exit_multiple: np.ndarray,
+    principal_at_refi: np.ndarray,
+    refi_loan_amount: np.ndarray,
+) -> pd.DataFrame:
+    """Assemble per-path output arrays into the compact (categorical/int16/float32) frame."""
+    return pd.DataFrame(
+        {
+            "status": pd.Categorical.from_codes(status, categories=STATUS_LABELS),
+            "month": month.astype(np.int16),
+            "final_equity": final_equity.astype(np.float32),
+            "irr": irr.astype(np.float32),
+            "exit_multiple": exit_multiple.astype(np.float32),
+            "principal_at_refi": principal_at_refi,
+            "refi_loan_amount": refi_loan_amount,
+        }
+    )
+
+
+# ==========================================
+# Compiled Fast Path (optional numba)
+# ==========================================
+
+
+def _simulate_paths(
+    pre_refi_rate,
+    post_refi_rate,
+    stab_noi,
+    post_noi,
+    delay_months,
+    ltv_limit,
+    distress_cost_rate,
+    exit_cost_rate,
+    initial_equity,
+    senior_loan,
+    fixed_cost,
+    completion_target,
+    opening_month,
+    exit_month,
+    share,
+    n_ramp,
+    cap_construction,
+    cap_stabilization,
+    cap_exit,
+    cap_rate,
+    distress_discount,
+    delay_cost_factor,
+):
+    """simulate_path over n paths, op for op (no fastmath); numba-compiled when installed."""
+    n = pre_refi_rate.shape[0]
+    status = np.full(n, SURVIVED_NO_EXIT, dtype=np.int8)
+    month = np.full(n, exit_month, dtype=np.int64)
+    final_equity = np.zeros(n)
+    irr = np.zeros(n)
+    exit_multiple = np.full(n, np.nan)
+    principal_at_refi = np.zeros(n)
+    refi_loan_amount = np.zeros(n)
+
+    for i in prange(n):
+        equity = initial_equity
+        principal = senior_loan
+        noi_lag2 = noi_lag1 = noi_cur = 0.0
+        rate = pre_refi_rate[i]
+        delay = delay_months[i]
+        completion = completion_target + delay
+        refi_month = completion + 3
+        done = False
+
+        for m in range(1, exit_month + 1):
+            if m < completion:
+                monthly_noi = 0.0
+                cap_ratio = cap_construction
+            elif m < opening_month:
+                ramp = min(1.0, share + (1 - share) * (m - completion) / n_ramp)
+                monthly_noi = stab_noi[i] * ramp
+                cap_ratio = cap_stabilization
+            else:
+                monthly_noi = post_noi[i]
+                cap_ratio = cap_exit
+            noi_lag2, noi_lag1, noi_cur = noi_lag1, noi_cur, monthly_noi
+
+            interest = principal * (rate / 12)
+            paid_interest = interest * (1 - cap_ratio)
+            principal += interest * cap_ratio
+
+            net_cash_flow = monthly_noi - (fixed_cost + paid_interest)
+            if net_cash_flow > 0:
+                principal -= net_cash_flow
+                if principal < 0:
+                    equity += -principal
+                    principal = 0.0
+            else:
+                equity += net_cash_flow
+
+            if m == completion and delay > 0:
+                equity -= delay * fixed_cost * delay_cost_factor
+
+            if equity <= 0:
+                status[i] = DEFAULT
+                month[i] = m
+                irr[i] = -1.0
+                principal_at_refi[i] = np.nan
+                refi_loan_amount[i] = np.nan
+                done = True
+                break
+
+            if m == refi_month:
+                rolling_noi = (noi_lag2 + noi_lag1 + noi_cur) / min(m, 3)
+                implied_val = max(0.0, rolling_noi * 12 / cap_rate)
+                max_refi_loan = implied_val * ltv_limit[i]
+                principal_at_refi[i] = principal
+                refi_loan_amount[i] = max_refi_loan
+
+                if principal > max_refi_loan:
+                    sale_val = implied_val * (1 - distress_discount)
+                    sale_cost = sale_val * distress_cost_rate[i]
+                    recovery = max(0.0, sale_val - principal - sale_cost)
+                    status[i] = REFI_FAIL
+                    month[i] = m
+                    final_equity[i] = recovery
+                    if recovery > 0:
+                        irr[i] = (recovery / initial_equity) ** (1 / (m / 12)) - 1
+                    else:
+                        irr[i] = -1.0
+                    done = True
+                    break
+                rate = post_refi_rate[i]
+
+            if m == exit_month:
+                final_val = max(0.0, monthly_noi * 12 / cap_rate)
+                exit_cost = final_val * exit_cost_rate[i]
+                exit_equity = final_val - principal - exit_cost
+                status[i] = EXIT
+                if exit_equity > 0:
+                    final_equity[i] = exit_equity
+                    irr[i] = (exit_equity / initial_equity) ** (1 / (m / 12)) - 1
+                    exit_multiple[i] = exit_equity / initial_equity
+                else:
+                    irr[i] = -1.0
+                    exit_multiple[i] = 0.0
+                done = True
+
+        if not done:
+            final_equity[i] = equity
+
+    return status, month, final_equity, irr, exit_multiple, principal_at_refi, refi_loan_amount
+
+
+# Explicit signature: compiled (or loaded from the on-disk cache) eagerly at
+# import, so the first dashboard run does not pay the JIT latency.
+_KERNEL_SIGNATURE = (
+    "Tuple((int8[:], int64[:], float64[:], float64[:], float64[:], float64[:], float64[:]))("
+    "float64[:], float64[:], float64[:], float64[:], int64[:], float64[:], float64[:], "
+    "float64[:], float64, float64, float64, int64, int64, int64, float64, int64, "
+    "float64, float64, float64, float64, float64, float64)"
+)
+
+try:
+    import numba
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+    _NUM_THREADS = numba.config.NUMBA_NUM_THREADS
+    _simulate_paths_kernel = njit(_KERNEL_SIGNATURE, cache=True)(_simulate_paths)
+    # Compiled lazily on first use
+    _simulate_paths_parallel = njit(parallel=True, cache=True)(_simulate_paths)
+except ImportError:
+    HAVE_NUMBA = False
+    _NUM_THREADS = 1
+    prange = range
+    _simulate_paths_kernel = _simulate_paths
+    _simulate_paths_parallel = _simulate_paths
+
 
 # ==========================================
 # Execution & Visualization
 # ==========================================
 
 
-def run_simulation(iterations: int = 30000, seed: int = 42, config: PFConfig = None):
-    """Executes the Monte Carlo simulation engine across specified iterations."""
-    rng = np.random.default_rng(seed)
+# Smallest block worth a spawned worker when workers=None picks the count:
+# process start-up costs seconds, the compiled kernel runs 50k paths in ~10 ms.
+_MIN_PATHS_PER_WORKER = 50_000
+
+
+def _simulate_block(config: PFConfig, n: int, seed_seq: np.random.SeedSequence) -> pd.DataFrame:
+    """Worker entry point: n paths on an independent child stream, one thread."""
+    model = PFInvestmentModel(config, np.random.default_rng(seed_seq))
+    # The pool already has a process per core; threads on top would oversubscribe
+    return model.simulate_many(n, parallel=False)
 
+
+def run_simulation(
+    iterations: int = 30000, seed: int = 42, config: PFConfig = None, workers: int | None = 1
+):
+    """
+    Executes the Monte Carlo simulation engine across specified iterations.
+
+    With workers > 1 the paths are split into one block per worker process,
+    each drawing from its own SeedSequence child of `seed`. Results are
+    reproducible for a given (seed, workers) pair but are not the same draws
+    as the single-process run. workers=None uses up to every available core,
+    with at least _MIN_PATHS_PER_WORKER paths per worker.
+    """
     if config is None:
         config = config_module.get_config()
+    if workers is None:
+        workers = max(1, min(os.cpu_count() or 1, iterations // _MIN_PATHS_PER_WORKER))
+    # Never more blocks than paths: an empty block has nothing to simulate
+    workers = min(workers, iterations)
+
+    if workers > 1:
+        sizes = [len(block) for block in np.array_split(np.arange(iterations), workers)]
+        seed_seqs = np.random.SeedSequence(seed).spawn(workers)
+        # Spawned, not forked: the parent may hold matplotlib state and numba
+        # worker threads, neither of which survives fork() cleanly.
+        spawn = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) as pool:
+            blocks = pool.map(_simulate_block, [config] * workers, sizes, seed_seqs)
+            return pd.concat(blocks, ignore_index=True), config
 
+    rng = np.random.default_rng(seed)
     model = PFInvestmentModel(config, rng)
-    results = [model.simulate_path() for _ in range(iterations)]
-    return pd.DataFrame(results), config
+    # All paths in one array pass. Same draws as the per-path reference
+    # (simulate_path over draw_shocks(iterations)), so results per seed match.
+    return model.simulate_many(iterations), config
 
 
 def plot_enhanced_results(df: pd.DataFrame, iterations: int, config: PFConfig, filename: str):
@@ -216,7 +764,7 @@ def plot_enhanced_results(df: pd.DataFrame, iterations: int, config: PFConfig, f
     Uses semantic color mapping for project status.
     """
     plt.style.use("seaborn-v0_8-muted")
-    _fig, axes = plt.subplots(2, 2, figsize=(18, 12))
+    fig, axes = plt.subplots(2, 2, figsize=(18, 12))
     axes = axes.flatten()
 
     # Semantic Color Map for professional risk reporting
@@ -227,8 +775,10 @@ def plot_enhanced_results(df: pd.DataFrame, iterations: int, config: PFConfig, f
         "survived_no_exit": "#3498DB",  # Partial - Blue
     }
 
-    # 1. Outcome Distribution
+    # 1. Outcome Distribution (categorical counts list every label; plot
+    # only the outcomes that occurred)
     counts = df["status"].value_counts()
+    counts = counts[counts > 0]
     colors = [color_map.get(s, "#BDC3C7") for s in counts.index]
     counts.plot(kind="bar", ax=axes[0], color=colors, edgecolor="black")
     axes[0].set_title("Project Outcome Distribution", fontweight="bold", fontsize=12)
@@ -242,14 +792,14 @@ def plot_enhanced_results(df: pd.DataFrame, iterations: int, config: PFConfig, f
             i, val, f"{val / iterations * 100:.1f}%", ha="center", va="bottom", fontweight="bold"
         )
 
-    # 2. Equity IRR Histogram
-    exit_df = df[df["status"] == "exit"]
-    if not exit_df.empty:
-        exit_df["irr"].plot(
-            kind="hist", bins=50, ax=axes[1], color="#3498DB", alpha=0.7, edgecolor="black"
-        )
-        median_irr = exit_df["irr"].median()
-        mean_irr = exit_df["irr"].mean()
+    # 2. Equity IRR Histogram (exit-case arrays pulled out once for panels 2 and 4)
+    codes = df["status"].cat.codes.to_numpy()
+    is_exit = codes == EXIT
+    exit_irr = df["irr"].to_numpy()[is_exit]
+    if exit_irr.size:
+        axes[1].hist(exit_irr, bins=50, color="#3498DB", alpha=0.7, edgecolor="black")
+        median_irr = np.median(exit_irr)
+        mean_irr = exit_irr.mean()
         axes[1].axvline(
             median_irr, color="red", linestyle="--", linewidth=2, label=f"Median: {median_irr:.1%}"
         )
@@ -264,10 +814,8 @@ def plot_enhanced_results(df: pd.DataFrame, iterations: int, config: PFConfig, f
 
     # 3. Survival Curve
     months = np.arange(1, 37)
-    survival_rates = []
-    for m in months:
-        failed = df[df["status"].isin(["default", "refi_fail"]) & (df["month"] <= m)]
-        survival_rates.append((iterations - len(failed)) / iterations)
+    failed = (codes == DEFAULT) | (codes == REFI_FAIL)
+    survival_rates = survival_curve(failed, df["month"].to_numpy(), max_month=36)
 
     axes[2].plot(months, survival_rates, marker="o", markersize=4, linewidth=2, color="#8E44AD")
     axes[2].fill_between(months, 0, survival_rates, alpha=0.3, color="#8E44AD")
@@ -280,11 +828,10 @@ def plot_enhanced_results(df: pd.DataFrame, iterations: int, config: PFConfig, f
     axes[2].text(1, 0.96, "95% Threshold", fontsize=9)
 
     # 4. Exit Multiple Distribution
-    if not exit_df.empty and "exit_multiple" in exit_df.columns:
-        exit_df["exit_multiple"].plot(
-            kind="hist", bins=40, ax=axes[3], color="#27AE60", alpha=0.7, edgecolor="black"
-        )
-        median_mult = exit_df["exit_multiple"].median()
+    if exit_irr.size and "exit_multiple" in df.columns:
+        exit_mult = df["exit_multiple"].to_numpy()[is_exit]
+        axes[3].hist(exit_mult, bins=40, color="#27AE60", alpha=0.7, edgecolor="black")
+        median_mult = np.median(exit_mult)
         axes[3].axvline(
             median_mult,
             color="red",
@@ -299,18 +846,20 @@ def plot_enhanced_results(df: pd.DataFrame, iterations: int, config: PFConfig, f
         axes[3].legend()
         axes[3].grid(True, alpha=0.3)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save the figure
     save_path = FIGURES_DIR / filename
-    plt.savefig(save_path, dpi=300, bbox_inches="tight")
+    fig.savefig(save_path, dpi=300, bbox_inches="tight")
     print(f"\n[Visual] Visualization saved to: {save_path}")
-    plt.close()
+    plt.close(fig)
 
 
 def print_summary_table(df: pd.DataFrame, config: PFConfig):
     """Print comprehensive risk analysis summary"""
-    exit_df = df[df["status"] == "exit"]
+    codes = df["status"].cat.codes.to_numpy()
+    is_exit = codes == EXIT
+    exit_irr = df["irr"].to_numpy()[is_exit]
 
     print("\n" + "=" * 70)
     print(f"    STOCHASTIC PF RISK ANALYSIS REPORT ({config.config_type})")
@@ -327,50 +876,51 @@ def print_summary_table(df: pd.DataFrame, config: PFConfig):
 
     print("\n[Outcome Probabilities]")
     print("-" * 70)
-    for status, count in df["status"].value_counts().items():
+    counts = df["status"].value_counts()
+    for status, count in counts[counts > 0].items():
         prob = count / len(df) * 100
         print(f"  {status:20s}: {prob:>6.2f}% ({count:>6,} cases)")
 
-    print(f"\n[Return Metrics - Exit Cases Only (n={len(exit_df):,})]")
+    print(f"\n[Return Metrics - Exit Cases Only (n={exit_irr.size:,})]")
     print("-" * 70)
-    if not exit_df.empty:
-        print(f"  Mean IRR             : {exit_df['irr'].mean():>8.2%}")
-        print(f"  Median IRR           : {exit_df['irr'].median():>8.2%}")
-        print(f"  Std Dev IRR          : {exit_df['irr'].std():>8.2%}")
-        print(f"  25th Percentile      : {exit_df['irr'].quantile(0.25):>8.2%}")
-        print(f"  75th Percentile      : {exit_df['irr'].quantile(0.75):>8.2%}")
-        if "exit_multiple" in exit_df.columns:
-            print(f"  Mean Exit Multiple   : {exit_df['exit_multiple'].mean():>8.2f}x")
-            print(f"  Median Exit Multiple : {exit_df['exit_multiple'].median():>8.2f}x")
+    if exit_irr.size:
+        irr_stats = distribution_summary(exit_irr)
+        print(f"  Mean IRR             : {irr_stats['mean']:>8.2%}")
+        print(f"  Median IRR           : {irr_stats['median']:>8.2%}")
+        print(f"  Std Dev IRR          : {irr_stats['std']:>8.2%}")
+        print(f"  25th Percentile      : {irr_stats['q25']:>8.2%}")
+        print(f"  75th Percentile      : {irr_stats['q75']:>8.2%}")
+        if "exit_multiple" in df.columns:
+            multiples = df["exit_multiple"].to_numpy()[is_exit]
+            print(f"  Mean Exit Multiple   : {multiples.mean():>8.2f}x")
+            print(f"  Median Exit Multiple : {np.median(multiples):>8.2f}x")
 
     print("\n[Risk Metrics]")
     print("-" * 70)
-    loss = config.initial_equity - df["final_equity"]
-    car_95 = np.percentile(loss, 95)
-    car_99 = np.percentile(loss, 99)
+    loss = config.initial_equity - df["final_equity"].to_numpy(dtype=np.float64)
+    # One partition pass for both VaR levels
+    car_95, car_99 = np.quantile(loss, [0.95, 0.99])
     expected_loss = loss.mean()
 
     print(f"  Expected Loss        : {expected_loss / config.initial_equity:>8.2%} of equity")
     print(f"  95% VaR (CaR)        : {car_95 / config.initial_equity:>8.2%} of equity")
     print(f"  99% VaR (CaR)        : {car_99 / config.initial_equity:>8.2%} of equity")
 
-    reached_refi = df[df["principal_at_refi"] > 0].copy()
-    if not reached_refi.empty:
-        reached_refi["funding_gap"] = (
-            reached_refi["principal_at_refi"] - reached_refi["refi_loan_amount"]
-        )
-        failed_refi = reached_refi[reached_refi["funding_gap"] > 0]
-        if not failed_refi.empty:
-            avg_gap = failed_refi["funding_gap"].mean()
-            recoveries = df[df["status"] == "refi_fail"]["final_equity"]
-            positive_recovery = (recoveries > 0).mean() if not recoveries.empty else 0.0
-            print(f"  Avg Failed-Refi Gap   : {avg_gap / config.initial_equity:>8.2f}x equity")
-            print(f"  Positive Recovery    : {positive_recovery:>8.2%} of refi failures")
+    principal_at_refi = df["principal_at_refi"].to_numpy()
+    reached_refi = principal_at_refi > 0
+    funding_gap = principal_at_refi[reached_refi] - df["refi_loan_amount"].to_numpy()[reached_refi]
+    failed_gap = funding_gap[funding_gap > 0]
+    if failed_gap.size:
+        avg_gap = failed_gap.mean()
+        recoveries = df["final_equity"].to_numpy()[codes == REFI_FAIL]
+        positive_recovery = (recoveries > 0).mean() if recoveries.size else 0.0
+        print(f"  Avg Failed-Refi Gap   : {avg_gap / config.initial_equity:>8.2f}x equity")
+        print(f"  Positive Recovery    : {positive_recovery:>8.2%} of refi failures")
 
     # Mean/Std of IRR, exit cases only. NOT a true Sharpe ratio: conditional
     # on success (survivorship) and no risk-free rate subtracted.
-    if len(exit_df) > 0 and exit_df["irr"].std() > 0:
-        ratio = exit_df["irr"].mean() / exit_df["irr"].std()
+    if exit_irr.size and irr_stats["std"] > 0:
+        ratio = irr_stats["mean"] / irr_stats["std"]
         print(f"  IRR Mean/Std (exits) : {ratio:>8.2f}")
 
     print("\n" + "=" * 70)
@@ -11,6 +11,7 @@ Output: data/processed/simulation_results.parquet
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timezone
 import json
 import uuid
@@ -38,8 +39,11 @@ def simulate(iterations: int = 30000, seed: int = 42) -> pd.DataFrame:
     # Inject calibrated rates if the calibrate stage has run.
     if config.CALIBRATION_JSON.exists():
         params = json.loads(config.CALIBRATION_JSON.read_text())
-        cfg.pre_refi_rate = tuple(params["pre_refi_rate"])
-        cfg.post_refi_rate = tuple(params["post_refi_rate"])
+        cfg = replace(
+            cfg,
+            pre_refi_rate=tuple(params["pre_refi_rate"]),
+            post_refi_rate=tuple(params["post_refi_rate"]),
+        )
         logger.info("Using calibrated rates pre={} post={}", cfg.pre_refi_rate, cfg.post_refi_rate)
     else:
         logger.warning("No calibration file; using default config rates.")
@@ -5,12 +5,20 @@ These cover the simulation contract (valid outcomes, reproducibility) and the
 core financial logic (interest capitalization, refinancing gate, insolvency).
 """
 
+from dataclasses import FrozenInstanceError, replace
+
 import numpy as np
+import pandas as pd
 import pytest
 
 from pf_liquidity_risk.configs import public_config
 from pf_liquidity_risk.modeling.config_model import PFConfig
-from pf_liquidity_risk.modeling.engine import PFInvestmentModel, run_simulation
+from pf_liquidity_risk.modeling.engine import (
+    STATUS_LABELS,
+    PFInvestmentModel,
+    print_summary_table,
+    run_simulation,
+)
 
 VALID_STATUSES = {"exit", "default", "refi_fail", "survived_no_exit"}
 
@@ -51,9 +59,15 @@ def test_config_rejects_non_positive_cap_rate(cfg):
         PFConfig(**values, cap_rate=0)
 
 
+def test_config_is_immutable_and_validates_cap_ratios(cfg):
+    with pytest.raises(FrozenInstanceError):
+        cfg.cap_rate = 0.05
+    with pytest.raises(ValueError, match="cap_ratio"):
+        replace(cfg, cap_ratio_stabilization=1.5)
+
+
 def test_income_approach_value_capitalizes_monthly_noi(cfg):
-    cfg.cap_rate = 0.05
-    model = PFInvestmentModel(cfg, np.random.default_rng(0))
+    model = PFInvestmentModel(replace(cfg, cap_rate=0.05), np.random.default_rng(0))
 
     assert model.income_approach_value(monthly_noi=5.0) == pytest.approx(1200.0)
 
@@ -83,12 +97,53 @@ def test_simulation_is_reproducible(cfg):
     assert df1["status"].tolist() == df2["status"].tolist()
 
 
+def test_parallel_simulation_is_reproducible(cfg):
+    df1, _ = run_simulation(iterations=501, seed=123, config=cfg, workers=2)
+    df2, _ = run_simulation(iterations=501, seed=123, config=cfg, workers=2)
+    assert len(df1) == 501
+    assert set(df1["status"].unique()).issubset(VALID_STATUSES)
+    pd.testing.assert_frame_equal(df1, df2)
+
+
+def test_fewer_iterations_than_workers_still_simulates_every_path(cfg):
+    df, _ = run_simulation(iterations=3, seed=1, config=cfg, workers=4)
+    assert len(df) == 3
+
+    empty, _ = run_simulation(iterations=0, seed=1, config=cfg)
+    assert empty.empty
+    assert list(empty.columns) == list(df.columns)
+
+
+def test_automatic_workers_keep_small_runs_in_process(cfg, monkeypatch):
+    from pf_liquidity_risk.modeling import engine
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("small runs must not start a process pool")
+
+    monkeypatch.setattr(engine.os, "cpu_count", lambda: 64)
+    monkeypatch.setattr(engine, "ProcessPoolExecutor", no_pool)
+    df, _ = run_simulation(iterations=500, seed=123, config=cfg, workers=None)
+    serial, _ = run_simulation(iterations=500, seed=123, config=cfg)
+    pd.testing.assert_frame_equal(df, serial)
+
+
 def test_outcome_probabilities_sum_to_one(cfg):
     df, _ = run_simulation(iterations=2000, seed=42, config=cfg)
     assert set(df["status"].unique()).issubset(VALID_STATUSES)
     assert np.isclose(df["status"].value_counts(normalize=True).sum(), 1.0)
 
 
+def test_status_is_categorical_and_summary_skips_empty_outcomes(cfg, capsys):
+    df, _ = run_simulation(iterations=500, seed=42, config=cfg)
+    assert list(df["status"].cat.categories) == list(STATUS_LABELS)
+    absent = [s for s in STATUS_LABELS if not (df["status"] == s).any()]
+
+    print_summary_table(df, cfg)
+    out = capsys.readouterr().out
+    for status in absent:
+        assert f"  {status:20s}:" not in out
+
+
 def test_high_leverage_produces_refinancing_risk(cfg):
     """The whole thesis: this deal is dominated by refinancing failure."""
     df, _ = run_simulation(iterations=3000, seed=42, config=cfg)
@@ -100,8 +155,7 @@ def test_lower_leverage_improves_survival(cfg):
     """Sanity check on the model's economics: less debt -> fewer refi failures."""
     high_lev, _ = run_simulation(iterations=3000, seed=7, config=cfg)
 
-    safer = public_config.get_config()
-    safer.senior_loan = cfg.senior_loan * 0.4  # much less debt
+    safer = replace(cfg, senior_loan=cfg.senior_loan * 0.4)  # much less debt
     low_lev, _ = run_simulation(iterations=3000, seed=7, config=safer)
 
     high_fail = high_lev["status"].value_counts(normalize=True).get("refi_fail", 0)
@@ -127,3 +181,86 @@ def test_exit_cases_have_finite_irr(cfg):
     if not exits.empty:
         assert exits["irr"].notna().all()
         assert np.isfinite(exits["irr"]).all()
+
+
+def test_batch_returns_valid_outcomes(cfg):
+    df = PFInvestmentModel(cfg, np.random.default_rng(0)).simulate_batch(2000)
+    assert len(df) == 2000
+    assert set(df["status"].unique()).issubset(VALID_STATUSES)
+    assert df["month"].between(1, cfg.exit_month).all()
+    assert (df["final_equity"] >= 0).all()
+    assert (df["irr"] >= -1.0).all()
+
+
+def test_batch_is_reproducible(cfg):
+    df1 = PFInvestmentModel(cfg, np.random.default_rng(123)).simulate_batch(500)
+    df2 = PFInvestmentModel(cfg, np.random.default_rng(123)).simulate_batch(500)
+    pd.testing.assert_frame_equal(df1, df2)
+
+
+def test_batch_matches_path_outcome_shares(cfg):
+    """The vectorized engine must reproduce the per-path model's economics."""
+    batch = PFInvestmentModel(cfg, np.random.default_rng(42)).simulate_batch(20000)
+    model = PFInvestmentModel(cfg, np.random.default_rng(43))
+    paths = pd.DataFrame([model.simulate_path() for _ in range(20000)])
+    batch_share = batch["status"].value_counts(normalize=True)
+    path_share = paths["status"].value_counts(normalize=True)
+    for status in VALID_STATUSES:
+        assert batch_share.get(status, 0) == pytest.approx(path_share.get(status, 0), abs=0.01)
+
+
+def test_batch_reproduces_paths_from_shared_shocks(cfg):
+    """Given the same pre-drawn shocks, both engines produce identical paths."""
+    model = PFInvestmentModel(cfg, np.random.default_rng(5))
+    shocks = model.draw_shocks(2000)
+    batch = model.simulate_batch(2000, shocks)
+    paths = pd.DataFrame([model.simulate_path(shocks, i) for i in range(2000)])
+    paths["status"] = pd.Categorical(paths["status"], categories=STATUS_LABELS)
+    pd.testing.assert_frame_equal(paths[batch.columns], batch, check_dtype=False)
+
+
+def test_many_matches_batch_from_shared_shocks(cfg):
+    """The compiled fast path (or its fallback) reproduces the batch engine."""
+    model = PFInvestmentModel(cfg, np.random.default_rng(5))
+    shocks = model.draw_shocks(2000)
+    pd.testing.assert_frame_equal(
+        model.simulate_many(2000, shocks), model.simulate_batch(2000, shocks)
+    )
+
+
+def test_compiled_kernel_matches_numba_free_run(cfg, monkeypatch):
+    pytest.importorskip("numba")
+    from pf_liquidity_risk.modeling import engine
+
+    model = PFInvestmentModel(cfg, np.random.default_rng(9))
+    shocks = model.draw_shocks(500)
+    # Serial on both sides: on multi-core hosts the default would pick the
+    # threaded build, which this patch does not replace
+    compiled = model.simulate_many(500, shocks, parallel=False)
+    monkeypatch.setattr(engine, "_simulate_paths_kernel", engine._simulate_paths)
+    pd.testing.assert_frame_equal(compiled, model.simulate_many(500, shocks, parallel=False))
+
+
+def test_parallel_kernel_matches_serial_kernel(cfg):
+    pytest.importorskip("numba")
+    from pf_liquidity_risk.modeling import engine
+
+    model = PFInvestmentModel(cfg, np.random.default_rng(11))
+    shocks = model.draw_shocks(500)
+    args = model._kernel_args(shocks)
+    for serial, parallel in zip(
+        engine._simulate_paths_kernel(*args), engine._simulate_paths_parallel(*args)
+    ):
+        np.testing.assert_array_equal(serial, parallel)
+
+
+def test_pool_worker_runs_the_serial_kernel(cfg, monkeypatch):
+    from pf_liquidity_risk.modeling import engine
+
+    def threaded(*args):
+        raise AssertionError("pool workers must not start kernel threads")
+
+    monkeypatch.setattr(engine, "_NUM_THREADS", 4)
+    monkeypatch.setattr(engine, "_simulate_paths_parallel", threaded)
+    block = engine._simulate_block(cfg, 200, np.random.SeedSequence(1))
+    assert len(block) == 200
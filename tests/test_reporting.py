@@ -1,7 +1,8 @@
+import numpy as np
 import pandas as pd
 import pytest
 
-from pf_liquidity_risk.reporting import equity_loss_metrics
+from pf_liquidity_risk.reporting import distribution_summary, equity_loss_metrics, survival_curve
 
 
 def test_equity_loss_metrics_use_saved_run_equity_basis():
@@ -18,3 +19,30 @@ def test_equity_loss_metrics_reject_invalid_inputs():
         equity_loss_metrics(pd.DataFrame({"final_equity": [0.0]}), initial_equity=0)
     with pytest.raises(ValueError, match="final_equity"):
         equity_loss_metrics(pd.DataFrame({"status": ["exit"]}), initial_equity=100)
+
+
+def test_survival_curve_counts_failures_cumulatively():
+    failed = np.array([True, False, True, True])
+    end_months = np.array([2, 36, 2, 4])
+
+    rates = survival_curve(failed, end_months, max_month=5)
+
+    np.testing.assert_allclose(rates, [1.0, 0.5, 0.5, 0.25, 0.25])
+    with pytest.raises(ValueError, match="empty"):
+        survival_curve(np.array([], dtype=bool), np.array([]), max_month=5)
+
+
+def test_distribution_summary_matches_pandas_describe():
+    values = np.array([0.05, -0.2, 0.12, 0.3, 0.07])
+    summary = distribution_summary(values)
+    desc = pd.Series(values).describe()
+
+    assert summary["count"] == 5
+    for key, name in (("mean", "mean"), ("std", "std"), ("min", "min"), ("max", "max")):
+        assert summary[key] == pytest.approx(desc[name])
+    assert summary["q25"] == pytest.approx(desc["25%"])
+    assert summary["median"] == pytest.approx(desc["50%"])
+    assert summary["q75"] == pytest.approx(desc["75%"])
+
+    with pytest.raises(ValueError, match="empty"):
+        distribution_summary(np.array([]))